@@ -4,14 +4,122 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import re
+import sys
+from collections import defaultdict
+from collections.abc import Mapping
+from itertools import chain
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
-import aiofiles
 
-from .const import DATA_TYPES
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+from .entity_id_utils import sanitize_for_entity_id
 
 _LOGGER = logging.getLogger(__name__)
 
+# Map device type to filename
+_DEVICE_FILE_MAP = {
+    "KWB Easyfire": "kwb_easyfire.json",
+    "KWB Multifire": "kwb_multifire.json",
+    "KWB Pelletfire+": "kwb_pelletfire_plus.json",
+    "KWB Combifire": "kwb_combifire.json",
+    "KWB CF 2": "kwb_cf2.json",
+    "KWB CF 1": "kwb_cf1.json",
+    "KWB CF 1.5": "kwb_cf1_5.json",
+    "KWB EasyAir Plus": "kwb_easyair_plus.json"
+}
+
+# Map equipment type to filename
+_EQUIPMENT_FILE_MAP = {
+    "Heizkreise": "heating_circuits.json",
+    "Pufferspeicher": "buffer_storage.json",
+    "Brauchwasserspeicher": "dhw_storage.json",
+    "Zweitwärmequellen": "secondary_heat_sources.json",
+    "Zirkulation": "circulation.json",
+    "Solar": "solar.json",
+    "Kesselfolgeschaltung": "boiler_sequence.json",
+    "Wärmemengenzähler": "heat_meters.json",
+    "Übergabestation": "transfer_station.json"
+}
+
+# Equipment type to index prefix mapping (all use German prefixes)
+# Format: (prefix, is_zero_indexed)
+_EQUIPMENT_INDEX_CONFIG = {
+    "Heizkreise": ("HK", False),           # HK 1.1, HK 2.1, etc.
+    "Pufferspeicher": ("PUF", True),       # PUF 0, PUF 1, etc. (0-indexed)
+    "Brauchwasserspeicher": ("BWS", False), # BWS 1, BWS 2, etc.
+    "Zweitwärmequellen": ("ZWQ", False),   # ZWQ 1, ZWQ 2, etc.
+    "Zirkulation": ("ZIR", True),          # ZIR 0, ZIR 1, etc. (0-indexed)
+    "Solar": ("SOL", False),               # SOL 1, SOL 2, etc.
+    "Kesselfolgeschaltung": ("KFS", False), # KFS 1, KFS 2, etc.
+    "Wärmemengenzähler": ("WMZ", True),    # WMZ 0, WMZ 1, etc. (0-indexed)
+}
+
+# Map equipment indices to friendly names (German)
+# All config files now use consistent German prefixes (HK, PUF, etc.)
+_EQUIPMENT_PREFIXES = {
+    "HK": ("Heizkreis", False),
+    "PUF": ("Pufferspeicher", True),   # 0-indexed
+    "BWS": ("Brauchwasserspeicher", False),
+    "ZWQ": ("Zweitwärmequelle", False),
+    "ZIR": ("Zirkulation", True),      # 0-indexed
+    "SOL": ("Solar", False),
+    "KFS": ("Kesselfolge", False),
+    "WMZ": ("Wärmemengenzähler", True), # 0-indexed
+}
+
+# Equipment configuration keys and their equipment types, in merge priority order
+_EQUIPMENT_CONFIG_KEYS = (
+    ("heating_circuits", "Heizkreise"),
+    ("buffer_storage", "Pufferspeicher"),
+    ("dhw_storage", "Brauchwasserspeicher"),
+    ("secondary_heat_sources", "Zweitwärmequellen"),
+    ("circulation", "Zirkulation"),
+    ("solar", "Solar"),
+    ("boiler_sequence", "Kesselfolgeschaltung"),
+    ("heat_meters", "Wärmemengenzähler"),
+)
+
+# Register fields with a small set of distinct string values
+_INTERNED_FIELDS = ("data_type", "type", "user_level", "expert_level", "unit_value_table")
+
+# All equipment prefixes, for a quick str.startswith() pre-check
+_ALL_PREFIXES = tuple(_EQUIPMENT_PREFIXES)
+
+# Matches an equipment prefix at the start of an index and captures the instance part
+_EQUIPMENT_PREFIX_RE = re.compile(
+    rf"^({'|'.join(map(re.escape, _EQUIPMENT_PREFIXES))})(.*)$", re.DOTALL
+)
+
+
+def _lowercased_level(register: dict, field: str, cached_field: str) -> str:
+    """Return a register's access level lowercased, preferring the value cached at load time."""
+    level = register.get(cached_field)
+    if level is None:
+        # Registers that did not go through _prepare_registers
+        level = (register.get(field) or "").lower()
+    return level
+
+
+def _add_registers(new_registers: list[dict], registers: dict[int, dict]) -> int:
+    """Add registers keyed by address, keeping the first definition of each address."""
+    added = 0
+    setdefault = registers.setdefault
+    for reg in new_registers:
+        addr = reg.get("starting_address")
+        if addr is None:
+            continue
+        if setdefault(addr, reg) is reg:
+            added += 1
+        else:
+            _LOGGER.debug("Skipping duplicate register at address %s: %s", addr, reg.get("name"))
+    return added
+
 
 class AsyncModularRegisterManager:
     """Manages KWB register definitions from modular configuration files (async)."""
@@ -57,11 +165,25 @@ class AsyncModularRegisterManager:
         self._meta_config: dict[str, Any] = {}
         self._universal_registers: list[dict] = []
         self._value_tables: dict[str, dict] = {}
-        self._alarm_codes: list[dict] = []
+        self._value_tables_view: Mapping[str, dict] = MappingProxyType(self._value_tables)
+        self._alarm_codes: tuple[dict, ...] = ()
 
         # Cache for loaded device and equipment configs
         self._device_cache: dict[str, list[dict]] = {}
         self._equipment_cache: dict[str, list[dict]] = {}
+        self._equipment_instances: dict[str, dict[str, list[dict]]] = {}
+
+        # Normalized registers per device/equipment type (normalization is access-level independent)
+        self._device_normalized: dict[str, list[dict]] = {}
+        self._equipment_normalized: dict[str, list[dict]] = {}
+
+        # Address lookup over all loaded registers (first loaded definition wins)
+        self._address_index: dict[int, dict] = {}
+
+        # Normalized registers pre-filtered per access level (registers are static after load)
+        self._universal_by_level: dict[str, list[dict]] = {}
+        self._device_by_level: dict[tuple[str, str], list[dict]] = {}
+        self._equipment_by_level: dict[tuple[str, str, int | None], list[dict]] = {}
 
         self._initialized = False
 
@@ -73,25 +195,28 @@ class AsyncModularRegisterManager:
         await self._load_base_configuration()
         self._initialized = True
 
+    @staticmethod
+    def _read_json_sync(path: Path) -> Any:
+        """Read and parse a JSON file in one blocking call (run in executor)."""
+        with open(path, 'rb') as f:
+            return _json_loads(f.read())
+
     async def _load_base_configuration(self) -> None:
         """Load base configuration (meta, universal, value tables) asynchronously."""
         try:
-            # Load universal registers from modbus_registers.json
-            modbus_registers_path = self.config_dir / "modbus_registers.json"
-            if modbus_registers_path.exists():
-                async with aiofiles.open(modbus_registers_path, 'r', encoding='utf-8') as f:
-                    content = await f.read()
-                    universal_data = json.loads(content)
-                    self._universal_registers = universal_data.get("universal_registers", [])
-            
-            # Load value tables
-            value_tables_path = self.config_dir / "value_tables.json"
-            if value_tables_path.exists():
-                async with aiofiles.open(value_tables_path, 'r', encoding='utf-8') as f:
-                    content = await f.read()
-                    value_tables_data = json.loads(content)
-                    self._value_tables = value_tables_data.get("value_tables", {})
-            
+            # Universal registers and value tables are independent files - load them concurrently
+            universal_registers, value_tables = await asyncio.gather(
+                self._load_universal(), self._load_value_tables()
+            )
+            if universal_registers is not None:
+                self._universal_registers = universal_registers
+            if value_tables is not None:
+                self._value_tables = value_tables
+                self._value_tables_view = MappingProxyType(value_tables)
+
+            self._index_universal_registers()
+            self._index_addresses(self._universal_registers)
+
             _LOGGER.info("Loaded async modular KWB configuration: %d universal registers, %d value tables", 
                         len(self._universal_registers), len(self._value_tables))
             
@@ -102,24 +227,46 @@ class AsyncModularRegisterManager:
             _LOGGER.error("Invalid JSON in configuration file: %s", exc)
             raise
 
+    @staticmethod
+    def _prepare_registers(registers: list[dict]) -> list[dict]:
+        """Cache lowercased access levels and share repeated strings on freshly loaded registers."""
+        for register in registers:
+            # Legacy files may stringify addresses - convert once here so every later
+            # lookup (address index, normalization, selection) sees an int
+            address = register.get("starting_address")
+            if type(address) is str and address.isdigit():
+                register["starting_address"] = int(address)
+            # Enum-like values repeat across thousands of registers - keep one copy of each
+            for key in _INTERNED_FIELDS:
+                value = register.get(key)
+                if type(value) is str:
+                    register[key] = sys.intern(value)
+            register["_user_level_lc"] = sys.intern((register.get("user_level") or "").lower())
+            register["_expert_level_lc"] = sys.intern((register.get("expert_level") or "").lower())
+        return registers
+
+    async def _load_universal(self) -> list[dict] | None:
+        """Load universal registers from modbus_registers.json."""
+        modbus_registers_path = self.config_dir / "modbus_registers.json"
+        if not modbus_registers_path.exists():
+            return None
+        universal_data = await asyncio.to_thread(self._read_json_sync, modbus_registers_path)
+        return self._prepare_registers(universal_data.get("universal_registers", []))
+
+    async def _load_value_tables(self) -> dict[str, dict] | None:
+        """Load value tables from value_tables.json."""
+        value_tables_path = self.config_dir / "value_tables.json"
+        if not value_tables_path.exists():
+            return None
+        value_tables_data = await asyncio.to_thread(self._read_json_sync, value_tables_path)
+        return value_tables_data.get("value_tables", {})
+
     async def _load_device_registers(self, device_type: str) -> list[dict]:
         """Load device-specific registers on demand asynchronously."""
         if device_type in self._device_cache:
             return self._device_cache[device_type]
         
-        # Map device type to filename
-        device_file_mapping = {
-            "KWB Easyfire": "kwb_easyfire.json",
-            "KWB Multifire": "kwb_multifire.json",
-            "KWB Pelletfire+": "kwb_pelletfire_plus.json",
-            "KWB Combifire": "kwb_combifire.json",
-            "KWB CF 2": "kwb_cf2.json",
-            "KWB CF 1": "kwb_cf1.json",
-            "KWB CF 1.5": "kwb_cf1_5.json",
-            "KWB EasyAir Plus": "kwb_easyair_plus.json"
-        }
-        
-        filename = device_file_mapping.get(device_type)
+        filename = _DEVICE_FILE_MAP.get(device_type)
         if not filename:
             _LOGGER.warning("Unknown device type: %s", device_type)
             self._device_cache[device_type] = []
@@ -127,13 +274,11 @@ class AsyncModularRegisterManager:
         
         device_path = self.config_dir / "devices" / filename
         try:
-            async with aiofiles.open(device_path, 'r', encoding='utf-8') as f:
-                content = await f.read()
-                device_data = json.loads(content)
-                registers = device_data.get("registers", [])
-                self._device_cache[device_type] = registers
-                _LOGGER.info("Loaded %d registers for device type %s", len(registers), device_type)
-                return registers
+            device_data = await asyncio.to_thread(self._read_json_sync, device_path)
+            registers = self._prepare_registers(device_data.get("registers", []))
+            self._device_cache[device_type] = registers
+            _LOGGER.info("Loaded %d registers for device type %s", len(registers), device_type)
+            return registers
                 
         except FileNotFoundError:
             _LOGGER.warning("Device configuration not found: %s", device_path)
@@ -149,20 +294,7 @@ class AsyncModularRegisterManager:
         if equipment_type in self._equipment_cache:
             return self._equipment_cache[equipment_type]
         
-        # Map equipment type to filename
-        equipment_file_mapping = {
-            "Heizkreise": "heating_circuits.json",
-            "Pufferspeicher": "buffer_storage.json",
-            "Brauchwasserspeicher": "dhw_storage.json",
-            "Zweitwärmequellen": "secondary_heat_sources.json",
-            "Zirkulation": "circulation.json",
-            "Solar": "solar.json",
-            "Kesselfolgeschaltung": "boiler_sequence.json",
-            "Wärmemengenzähler": "heat_meters.json",
-            "Übergabestation": "transfer_station.json"
-        }
-        
-        filename = equipment_file_mapping.get(equipment_type)
+        filename = _EQUIPMENT_FILE_MAP.get(equipment_type)
         if not filename:
             _LOGGER.warning("Unknown equipment type: %s", equipment_type)
             self._equipment_cache[equipment_type] = []
@@ -170,13 +302,11 @@ class AsyncModularRegisterManager:
         
         equipment_path = self.config_dir / "equipment" / filename
         try:
-            async with aiofiles.open(equipment_path, 'r', encoding='utf-8') as f:
-                content = await f.read()
-                equipment_data = json.loads(content)
-                registers = equipment_data.get("registers", [])
-                self._equipment_cache[equipment_type] = registers
-                _LOGGER.info("Loaded %d registers for equipment type %s", len(registers), equipment_type)
-                return registers
+            equipment_data = await asyncio.to_thread(self._read_json_sync, equipment_path)
+            registers = self._prepare_registers(equipment_data.get("registers", []))
+            self._equipment_cache[equipment_type] = registers
+            _LOGGER.info("Loaded %d registers for equipment type %s", len(registers), equipment_type)
+            return registers
                 
         except FileNotFoundError:
             _LOGGER.warning("Equipment configuration not found: %s", equipment_path)
@@ -187,88 +317,86 @@ class AsyncModularRegisterManager:
             self._equipment_cache[equipment_type] = []
             return []
 
-    def get_registers_for_access_level(self, access_level: str, limit: int = 1000) -> list[dict]:
-        """Get limited universal registers for the specified access level."""
-        registers = []
-        count = 0
-        
-        for register in self._universal_registers:
-            if count >= limit:
-                break
-                
-            if self._register_allowed_for_access_level(register, access_level):
-                # Only include registers with valid addresses
+    def _index_universal_registers(self) -> None:
+        """Normalize universal registers once and group them by access level."""
+        self._universal_by_level = {}
+        for access_level in ("UserLevel", "ExpertLevel"):
+            registers = []
+            for register in self._universal_registers:
+                if not self._register_allowed_for_access_level(register, access_level):
+                    continue
+                # Only include registers with valid addresses (converted to int on load)
                 starting_address = register.get("starting_address")
-                if starting_address and (isinstance(starting_address, int) or (isinstance(starting_address, str) and starting_address.isdigit())):
-                    # Convert string to int if needed
-                    if isinstance(starting_address, str):
-                        register["starting_address"] = int(starting_address)
+                if starting_address and isinstance(starting_address, int):
                     registers.append(self._normalize_register(register))
-                    count += 1
-        
+            self._universal_by_level[access_level] = registers
+
+    def get_registers_for_access_level(self, access_level: str, limit: int = 1000) -> list[dict]:
+        """Get limited universal registers for the specified access level."""
+        registers = self._universal_by_level.get(access_level, [])[:limit]
+
         _LOGGER.info("Selected %d universal registers for access level %s (limit: %d)", 
                     len(registers), access_level, limit)
         return registers
 
     async def get_device_specific_registers(self, device_type: str, access_level: str) -> list[dict]:
         """Get device-specific registers for the access level."""
-        registers = []
-        
-        device_registers = await self._load_device_registers(device_type)
-        for register in device_registers:
-            if self._register_allowed_for_access_level(register, access_level):
-                registers.append(self._normalize_register(register))
+        cache_key = (device_type, access_level)
+        if cache_key in self._device_by_level:
+            return list(self._device_by_level[cache_key])
+
+        device_registers = self._device_normalized.get(device_type)
+        if device_registers is None:
+            device_registers = [
+                self._normalize_register(register)
+                for register in await self._load_device_registers(device_type)
+            ]
+            self._device_normalized[device_type] = device_registers
+
+        registers = [
+            register for register in device_registers
+            if self._register_allowed_for_access_level(register, access_level)
+        ]
         
-        return registers
+        self._device_by_level[cache_key] = registers
+        return list(registers)
 
     async def get_equipment_registers(self, equipment_type: str, access_level: str, count: int | None = None) -> list[dict]:
         """Get equipment-specific registers for the access level, limited by count."""
-        registers = []
-
-        equipment_registers = await self._load_equipment_registers(equipment_type)
-
-        # Equipment type to index prefix mapping (all use German prefixes)
-        # Format: (prefix, is_zero_indexed)
-        equipment_index_config = {
-            "Heizkreise": ("HK", False),           # HK 1.1, HK 2.1, etc.
-            "Pufferspeicher": ("PUF", True),       # PUF 0, PUF 1, etc. (0-indexed)
-            "Brauchwasserspeicher": ("BWS", False), # BWS 1, BWS 2, etc.
-            "Zweitwärmequellen": ("ZWQ", False),   # ZWQ 1, ZWQ 2, etc.
-            "Zirkulation": ("ZIR", True),          # ZIR 0, ZIR 1, etc. (0-indexed)
-            "Solar": ("SOL", False),               # SOL 1, SOL 2, etc.
-            "Kesselfolgeschaltung": ("KFS", False), # KFS 1, KFS 2, etc.
-            "Wärmemengenzähler": ("WMZ", True),    # WMZ 0, WMZ 1, etc. (0-indexed)
-        }
+        cache_key = (equipment_type, access_level, count)
+        if cache_key in self._equipment_by_level:
+            return list(self._equipment_by_level[cache_key])
+
+        equipment_registers = self._equipment_normalized.get(equipment_type)
+        if equipment_registers is None:
+            equipment_registers = [
+                self._normalize_register(register)
+                for register in await self._load_equipment_registers(equipment_type)
+            ]
+            self._equipment_normalized[equipment_type] = equipment_registers
 
         # If count is specified and > 0, filter by index patterns
         if count is not None and count > 0:
             filtered_registers = []
 
-            config = equipment_index_config.get(equipment_type)
+            config = _EQUIPMENT_INDEX_CONFIG.get(equipment_type)
             if config:
                 prefix, is_zero_indexed = config
                 start_idx = 0 if is_zero_indexed else 1
                 end_idx = count if is_zero_indexed else count + 1
 
-                for i in range(start_idx, end_idx):
-                    for register in equipment_registers:
-                        index = register.get("index", "")
-                        # Handle both exact match (PUF 0) and prefix match (HK 1.)
-                        if equipment_type == "Heizkreise":
-                            # Heating circuits use HK 1.1, HK 1.2, HK 2.1, etc.
-                            if index.startswith(f"{prefix} {i}."):
-                                filtered_registers.append(register)
-                        else:
-                            # Other equipment uses exact match (PUF 0, BWS 1, etc.)
-                            if index == f"{prefix} {i}":
-                                filtered_registers.append(register)
+                by_instance = self._get_equipment_instances(equipment_type, prefix, equipment_registers)
+                filtered_registers = list(chain.from_iterable(
+                    by_instance.get(str(i), ()) for i in range(start_idx, end_idx)
+                ))
             else:
                 # For unknown equipment types, use simple count-based filtering
                 instances_seen = set()
                 for register in equipment_registers:
                     index = register.get("index", "")
                     if index:
-                        instance_id = index.split()[-1] if index.split() else "1"
+                        parts = index.split()
+                        instance_id = parts[-1] if parts else "1"
                         if instance_id not in instances_seen and len(instances_seen) < count:
                             instances_seen.add(instance_id)
                         if instance_id in instances_seen:
@@ -278,88 +406,87 @@ class AsyncModularRegisterManager:
         else:
             limited_registers = equipment_registers
 
-        for register in limited_registers:
-            if self._register_allowed_for_access_level(register, access_level):
-                registers.append(self._normalize_register(register))
+        registers = [
+            register for register in limited_registers
+            if self._register_allowed_for_access_level(register, access_level)
+        ]
 
         _LOGGER.info("Selected %d %s registers for access level %s (count: %s)",
                     len(registers), equipment_type, access_level, count)
-        return registers
+        self._equipment_by_level[cache_key] = registers
+        return list(registers)
+
+    def _get_equipment_instances(
+        self, equipment_type: str, prefix: str, equipment_registers: list[dict]
+    ) -> dict[str, list[dict]]:
+        """Group equipment registers by instance number (built once per equipment type)."""
+        by_instance = self._equipment_instances.get(equipment_type)
+        if by_instance is not None:
+            return by_instance
+
+        by_instance = defaultdict(list)
+        for register in equipment_registers:
+            index_prefix, separator, instance_id = register.get("index", "").partition(" ")
+            if index_prefix != prefix or not separator:
+                continue
+            if equipment_type == "Heizkreise":
+                # Heating circuits use HK 1.1, HK 1.2, HK 2.1, etc. - group by circuit number
+                instance_id, dot, _ = instance_id.partition(".")
+                if not dot:
+                    continue
+            # Other equipment uses exact match (PUF 0, BWS 1, etc.)
+            by_instance[instance_id].append(register)
+
+        self._equipment_instances[equipment_type] = by_instance
+        return by_instance
 
     async def get_all_registers(self, access_level: str, equipment_config: dict = None, device_type: str | None = None) -> list[dict]:
         """Get all registers for the access level, selected equipment, and device type."""
-        await self.initialize()  # Ensure async initialization
-
-        registers = []
-        seen_addresses: set[int] = set()  # Track addresses to prevent duplicates
-
-        def add_registers(new_registers: list[dict]) -> int:
-            """Add registers while preventing duplicates by address."""
-            added = 0
-            for reg in new_registers:
-                addr = reg.get("starting_address")
-                if addr is not None and addr not in seen_addresses:
-                    seen_addresses.add(addr)
-                    registers.append(reg)
-                    added += 1
-                elif addr in seen_addresses:
-                    _LOGGER.debug("Skipping duplicate register at address %s: %s", addr, reg.get("name"))
-            return added
+        # Device- and equipment-specific registers are loaded concurrently; results are
+        # merged in list order so universal > device > equipment priority is kept
+        coros = []
+        if device_type:
+            coros.append(self.get_device_specific_registers(device_type, access_level))
+
+        # Equipment-specific registers based on configuration (using counts)
+        equipment_types = []
+        if equipment_config:
+            for config_key, equipment_type in _EQUIPMENT_CONFIG_KEYS:
+                equipment_count = equipment_config.get(config_key, 0)
+                if equipment_count > 0:
+                    equipment_types.append(equipment_type)
+                    coros.append(self.get_equipment_registers(equipment_type, access_level, equipment_count))
+
+        # Device and equipment files do not depend on the base configuration, so they
+        # are read while it loads instead of after it
+        _, *results = await asyncio.gather(self.initialize(), *coros)
+
+        # Keyed by address to prevent duplicates; dicts keep insertion order
+        registers: dict[int, dict] = {}
 
         # Universal registers (added first, take priority)
         universal_regs = self.get_registers_for_access_level(access_level)
-        add_registers(universal_regs)
+        _add_registers(universal_regs, registers)
+
+        # Index the loaded files here rather than in the loaders, so the address lookup
+        # follows the same priority and does not depend on which load finished first
+        if device_type:
+            self._index_addresses(self._device_cache.get(device_type, ()))
+        for equipment_type in equipment_types:
+            self._index_addresses(self._equipment_cache.get(equipment_type, ()))
 
-        # Device-specific registers (skip duplicates already in universal)
         if device_type:
-            device_registers = await self.get_device_specific_registers(device_type, access_level)
-            added = add_registers(device_registers)
+            # Device-specific registers (skip duplicates already in universal)
+            device_registers = results[0]
+            added = _add_registers(device_registers, registers)
             _LOGGER.info("Added %d device-specific registers for %s (skipped %d duplicates)",
                         added, device_type, len(device_registers) - added)
+            results = results[1:]
 
-        # Equipment-specific registers based on configuration (using counts)
-        if equipment_config:
-            heating_circuits_count = equipment_config.get("heating_circuits", 0)
-            if heating_circuits_count > 0:
-                equipment_regs = await self.get_equipment_registers("Heizkreise", access_level, heating_circuits_count)
-                add_registers(equipment_regs)
-
-            buffer_storage_count = equipment_config.get("buffer_storage", 0)
-            if buffer_storage_count > 0:
-                equipment_regs = await self.get_equipment_registers("Pufferspeicher", access_level, buffer_storage_count)
-                add_registers(equipment_regs)
-
-            dhw_storage_count = equipment_config.get("dhw_storage", 0)
-            if dhw_storage_count > 0:
-                equipment_regs = await self.get_equipment_registers("Brauchwasserspeicher", access_level, dhw_storage_count)
-                add_registers(equipment_regs)
-
-            secondary_heat_sources_count = equipment_config.get("secondary_heat_sources", 0)
-            if secondary_heat_sources_count > 0:
-                equipment_regs = await self.get_equipment_registers("Zweitwärmequellen", access_level, secondary_heat_sources_count)
-                add_registers(equipment_regs)
-
-            circulation_count = equipment_config.get("circulation", 0)
-            if circulation_count > 0:
-                equipment_regs = await self.get_equipment_registers("Zirkulation", access_level, circulation_count)
-                add_registers(equipment_regs)
-
-            solar_count = equipment_config.get("solar", 0)
-            if solar_count > 0:
-                equipment_regs = await self.get_equipment_registers("Solar", access_level, solar_count)
-                add_registers(equipment_regs)
-
-            boiler_sequence_count = equipment_config.get("boiler_sequence", 0)
-            if boiler_sequence_count > 0:
-                equipment_regs = await self.get_equipment_registers("Kesselfolgeschaltung", access_level, boiler_sequence_count)
-                add_registers(equipment_regs)
-
-            heat_meters_count = equipment_config.get("heat_meters", 0)
-            if heat_meters_count > 0:
-                equipment_regs = await self.get_equipment_registers("Wärmemengenzähler", access_level, heat_meters_count)
-                add_registers(equipment_regs)
+        for equipment_regs in results:
+            _add_registers(equipment_regs, registers)
 
-        return registers
+        return list(registers.values())
 
     def _register_allowed_for_access_level(self, register: dict, access_level: str) -> bool:
         """Check if register is allowed for the given access level."""
@@ -368,104 +495,76 @@ class AsyncModularRegisterManager:
             return True
         elif access_level == "UserLevel":
             # User level: must have read access for user level
-            user_level = register.get("user_level", "")
-            return "read" in user_level.lower()
+            return "read" in _lowercased_level(register, "user_level", "_user_level_lc")
         
         return False
 
     def _normalize_register(self, register: dict) -> dict:
-        """Normalize register definition."""
-        normalized = register.copy()
-        
-        # Ensure starting_address is integer
-        if "starting_address" in normalized:
-            addr = normalized["starting_address"]
-            if isinstance(addr, str) and addr.isdigit():
-                normalized["starting_address"] = int(addr)
+        """Normalize register definition in place (only once per register)."""
+        if register.get("_normalized"):
+            return register
+        normalized = register
         
         # Add equipment prefix to name for better identification
         index = normalized.get("index", "")
         name = normalized.get("name", "")
         
-        if index and name:
-            # Map equipment indices to friendly names (German)
-            # All config files now use consistent German prefixes (HK, PUF, etc.)
-            equipment_prefixes = {
-                "HK": ("Heizkreis", False),
-                "PUF": ("Pufferspeicher", True),   # 0-indexed
-                "BWS": ("Brauchwasserspeicher", False),
-                "ZWQ": ("Zweitwärmequelle", False),
-                "ZIR": ("Zirkulation", True),      # 0-indexed
-                "SOL": ("Solar", False),
-                "KFS": ("Kesselfolge", False),
-                "WMZ": ("Wärmemengenzähler", True), # 0-indexed
-            }
-
-            # Extract equipment type and number from index
-            for prefix, (friendly_name, is_zero_indexed) in equipment_prefixes.items():
-                if index.startswith(prefix):
-                    # Extract the equipment number/identifier
-                    equipment_id = index[len(prefix):].strip()
-
-                    # Handle 0-indexed equipment types (convert to 1-based for display)
-                    if is_zero_indexed:
-                        try:
-                            display_num = int(equipment_id) + 1
-                            new_name = f"{friendly_name} {display_num}: {name}"
-                        except ValueError:
-                            new_name = f"{friendly_name} {equipment_id}: {name}"
-                    else:
-                        # Default: HC 1.1 -> Heizkreis 1.1
-                        new_name = f"{friendly_name} {equipment_id}: {name}"
-
-                    normalized["name"] = new_name
-                    break
+        # Cheap tuple probe first; most indices carry no equipment prefix
+        if index and name and index.startswith(_ALL_PREFIXES):
+            # Extract equipment type and number from index in a single match
+            match = _EQUIPMENT_PREFIX_RE.match(index)
+            if match:
+                friendly_name, is_zero_indexed = _EQUIPMENT_PREFIXES[match.group(1)]
+                # Extract the equipment number/identifier
+                equipment_id = match.group(2).strip()
+
+                # Handle 0-indexed equipment types (convert to 1-based for display)
+                if is_zero_indexed and equipment_id.isdecimal():
+                    new_name = f"{friendly_name} {int(equipment_id) + 1}: {name}"
+                else:
+                    # Default: HC 1.1 -> Heizkreis 1.1
+                    new_name = f"{friendly_name} {equipment_id}: {name}"
+
+                normalized["name"] = new_name
+
+        # Sanitized entity ID suffix, computed once instead of per entity/platform
+        if not normalized.get("entity_id"):
+            normalized["entity_id"] = sanitize_for_entity_id(normalized.get("name", ""))
         
+        # Lowercased levels are cached on the register at load time
+        user_level = _lowercased_level(normalized, "user_level", "_user_level_lc")
+        expert_level = _lowercased_level(normalized, "expert_level", "_expert_level_lc")
+
         # Add default access level if missing
         if "access_level" not in normalized:
-            user_level = normalized.get("user_level", "read")
-            expert_level = normalized.get("expert_level", "read")
-            
-            if "write" in user_level.lower():
+            if "write" in user_level:
                 normalized["access_level"] = "UserLevel"
-            elif "write" in expert_level.lower():
+            elif "write" in expert_level:
                 normalized["access_level"] = "ExpertLevel"
             else:
                 normalized["access_level"] = "UserLevel"
         
         # Set access field based on user_level and expert_level for entity creation
-        user_level = normalized.get("user_level", "read")
-        expert_level = normalized.get("expert_level", "read")
-        
-        if "readwrite" in user_level.lower() or "readwrite" in expert_level.lower():
-            normalized["access"] = "RW"
-        elif "write" in user_level.lower() or "write" in expert_level.lower():
+        # ("write" also covers "readwrite")
+        if "write" in user_level or "write" in expert_level:
             normalized["access"] = "RW"
         else:
             normalized["access"] = "R"
-        
+
+        normalized["_normalized"] = True
         return normalized
 
+    def _index_addresses(self, registers: list[dict]) -> None:
+        """Add loaded registers to the address lookup without replacing earlier entries."""
+        address_index = self._address_index
+        for register in registers:
+            address = register.get("starting_address")
+            if address is not None:
+                address_index.setdefault(address, register)
+
     def get_register_by_address(self, address: int) -> dict | None:
         """Get register definition by address."""
-        # Search in all loaded registers
-        for register in self._universal_registers:
-            if register.get("starting_address") == address:
-                return register
-        
-        # Search in cached device registers
-        for device_registers in self._device_cache.values():
-            for register in device_registers:
-                if register.get("starting_address") == address:
-                    return register
-        
-        # Search in cached equipment registers
-        for equipment_registers in self._equipment_cache.values():
-            for register in equipment_registers:
-                if register.get("starting_address") == address:
-                    return register
-        
-        return None
+        return self._address_index.get(address)
 
     def get_value_table(self, table_name: str) -> dict | None:
         """Get specific value table by name."""
@@ -476,13 +575,13 @@ class AsyncModularRegisterManager:
         return table_name in self._value_tables
 
     @property
-    def value_tables(self) -> dict[str, dict]:
-        """Get value tables."""
-        return self._value_tables
+    def value_tables(self) -> Mapping[str, dict]:
+        """Get value tables (read-only view)."""
+        return self._value_tables_view
 
     @property
-    def alarm_codes(self) -> list[dict]:
-        """Get alarm codes."""
+    def alarm_codes(self) -> tuple[dict, ...]:
+        """Get alarm codes (read-only)."""
         return self._alarm_codes
 
     async def reload_for_version_language(self, version: str, language: str) -> None:
@@ -510,9 +609,17 @@ class AsyncModularRegisterManager:
         # Clear all caches
         self._universal_registers = []
         self._value_tables = {}
-        self._alarm_codes = []
+        self._value_tables_view = MappingProxyType(self._value_tables)
+        self._alarm_codes = ()
         self._device_cache.clear()
         self._equipment_cache.clear()
+        self._equipment_instances.clear()
+        self._address_index.clear()
+        self._universal_by_level = {}
+        self._device_normalized.clear()
+        self._equipment_normalized.clear()
+        self._device_by_level.clear()
+        self._equipment_by_level.clear()
 
         # Mark as uninitialized and reload
         self._initialized = False
@@ -1,17 +1,14 @@
 """Data update coordinator for KWB Heating integration."""
 from __future__ import annotations
 
-import asyncio
 import logging
-import re
 from datetime import timedelta
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_PORT
 from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryNotReady
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .const import (
     DOMAIN,
@@ -31,6 +28,7 @@ from .const import (
     DEFAULT_UPDATE_INTERVAL,
 )
 from .data_conversion import KWBDataConverter
+from .entity_id_utils import sanitize_for_entity_id
 from .modbus_client import KWBModbusClient
 from .async_modular_register_manager import AsyncModularRegisterManager
 from .version_manager import VersionManager
@@ -38,17 +36,6 @@ from .language_manager import LanguageManager
 
 _LOGGER = logging.getLogger(__name__)
 
-# Pre-compiled regex for entity ID sanitization (more efficient than chained replace)
-_ENTITY_ID_INVALID_CHARS = re.compile(r"[^a-z0-9_]")
-
-# Character replacements for entity ID sanitization
-_ENTITY_ID_REPLACEMENTS = str.maketrans({
-    " ": "_", ".": "_", "/": "_", "-": "_", ":": "_",
-    "ä": "ae", "ö": "oe", "ü": "ue", "ß": "ss",
-    "&": "and", "@": "at",
-    "(": "", ")": "", "#": "", "!": "", "?": "", ",": "", ";": "", "'": "", '"': "",
-})
-
 
 class KWBDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching data from the KWB heating system."""
@@ -179,9 +166,28 @@ class KWBDataUpdateCoordinator(DataUpdateCoordinator):
             device_type
         )
         
+        self._register_columns = self._build_register_columns(self._registers)
+        # Addresses are unique (the register manager drops duplicates)
+        self._register_by_address = {
+            register["starting_address"]: register for register in self._registers
+        }
+        self.register_addresses: frozenset[int] = frozenset(self._register_by_address)
+
         _LOGGER.info("Set up %d registers for access level %s, device type %s with equipment: %s", 
                     len(self._registers), access_level, device_type, equipment_config)
 
+    @staticmethod
+    def _build_register_columns(registers: list[dict]) -> dict[str, Any]:
+        """Build column views of the fields platform setup filters on.
+
+        Column i belongs to registers[i], so setup loops can scan just the fields
+        they need and only touch the register dict for registers they keep.
+        """
+        return {
+            "user_level": [register.get("user_level") for register in registers],
+            "expert_level": [register.get("expert_level") for register in registers],
+        }
+
     async def async_update_config(self, data: dict, options: dict) -> None:
         """Update configuration and reinitialize if needed."""
         _LOGGER.info("Updating coordinator configuration")
@@ -290,11 +296,7 @@ class KWBDataUpdateCoordinator(DataUpdateCoordinator):
                 await self.modbus_client.connect()
             
             # Find register definition
-            register = None
-            for reg in self._registers:
-                if reg["starting_address"] == address:
-                    register = reg
-                    break
+            register = self.get_register_by_address(address)
             
             if not register:
                 _LOGGER.error("Register %d not found in configuration", address)
@@ -337,10 +339,8 @@ class KWBDataUpdateCoordinator(DataUpdateCoordinator):
 
     def get_register_by_address(self, address: int) -> dict | None:
         """Get register definition by address."""
-        if hasattr(self, '_registers') and self._registers:
-            for register in self._registers:
-                if register.get("starting_address") == address:
-                    return register
+        if hasattr(self, '_register_by_address'):
+            return self._register_by_address.get(address)
         return None
 
     def get_registers_by_category(self, category: str) -> list[dict]:
@@ -388,17 +388,8 @@ class KWBDataUpdateCoordinator(DataUpdateCoordinator):
         return device_name
 
     def sanitize_for_entity_id(self, text: str) -> str:
-        """Sanitize text for use in entity IDs - shared method for consistent entity naming.
-
-        Uses pre-compiled translation table and regex for better performance.
-        """
-        # Apply character translations and convert to lowercase
-        result = text.lower().translate(_ENTITY_ID_REPLACEMENTS)
-        # Remove any remaining invalid characters
-        result = _ENTITY_ID_INVALID_CHARS.sub("", result)
-        # Collapse multiple underscores and strip leading/trailing underscores
-        result = re.sub(r"_+", "_", result).strip("_")
-        return result
+        """Sanitize text for use in entity IDs - shared method for consistent entity naming."""
+        return sanitize_for_entity_id(text)
 
     def generate_entity_unique_id(self, register: dict) -> str:
         """Generate consistent unique ID for entities based on device identifier."""
@@ -412,8 +403,8 @@ class KWBDataUpdateCoordinator(DataUpdateCoordinator):
         # Get device name prefix for entity naming
         device_prefix = self.device_name_prefix.lower().replace(" ", "_")
         
-        # Sanitize the base name for use in entity ID
-        base_id = self.sanitize_for_entity_id(base_name)
+        # Sanitized name is precomputed by the register manager during normalization
+        base_id = register.get("entity_id") or self.sanitize_for_entity_id(base_name)
         
         # Create unique ID with device prefix, consistent device identifier and proper prefix
         return f"kwb_heating_{device_identifier}_{device_prefix}_{base_id}_{address}"
@@ -3,15 +3,50 @@ from __future__ import annotations
 
 import logging
 import re
-from typing import Any
+from collections.abc import Mapping
+from typing import Any, NamedTuple
 
 _LOGGER = logging.getLogger(__name__)
 
+# Map units to Home Assistant device classes
+_DEVICE_CLASS_MAPPING = {
+    "°C": "temperature",
+    "°F": "temperature",
+    "%": None,  # Could be humidity, battery, etc. - let HA decide
+    "bar": "pressure",
+    "Pa": "pressure",
+    "kW": "power",
+    "W": "power",
+    "V": "voltage",
+    "A": "current",
+    "Hz": "frequency",
+}
+
+# Numeric range per register data type (other types fall back to the defaults below)
+_MIN_VALUES = {"s16": -32768.0}
+_MAX_VALUES = {
+    "u16": 65535.0,
+    "s16": 32767.0,
+    "u32": 4294967295.0,
+    "s32": 4294967295.0,
+}
+_DEFAULT_MIN_VALUE = 0.0
+_DEFAULT_MAX_VALUE = 1000000.0
+
+
+class RegisterMeta(NamedTuple):
+    """Entity-relevant properties derived from a register definition."""
+
+    unit: str | None
+    device_class: str | None
+    is_numeric: bool
+    has_value_table: bool
+
 
 class KWBDataConverter:
     """Handle data conversion between Modbus values and Home Assistant values."""
     
-    def __init__(self, value_tables: dict[str, dict[str, str]]):
+    def __init__(self, value_tables: Mapping[str, dict[str, str]]):
         """Initialize the data converter with value tables."""
         self.value_tables = value_tables
     
@@ -210,21 +245,26 @@ class KWBDataConverter:
         if not unit:
             return None
 
-        # Map units to device classes
-        device_class_mapping = {
-            "°C": "temperature",
-            "°F": "temperature",
-            "%": None,  # Could be humidity, battery, etc. - let HA decide
-            "bar": "pressure",
-            "Pa": "pressure",
-            "kW": "power",
-            "W": "power",
-            "V": "voltage",
-            "A": "current",
-            "Hz": "frequency",
-        }
+        return _DEVICE_CLASS_MAPPING.get(unit)
 
-        return device_class_mapping.get(unit)
+    def describe(self, register: dict) -> RegisterMeta:
+        """Derive unit, device class and value kind of a register in one pass.
+
+        Args:
+            register: Register configuration dictionary
+
+        Returns:
+            RegisterMeta with the same results as get_unit, get_device_class,
+            is_numeric and has_value_table
+        """
+        unit = self.get_unit_of_measurement(register)
+        has_value_table = self.has_value_table(register)
+        return RegisterMeta(
+            unit=unit,
+            device_class=_DEVICE_CLASS_MAPPING.get(unit) if unit else None,
+            is_numeric=not has_value_table and self._is_numeric_unit(register.get("unit_value_table", "")),
+            has_value_table=has_value_table,
+        )
     
     def is_read_write_register(self, register_config: dict[str, Any], access_level: str) -> bool:
         """Check if register is read-write for the given access level."""
@@ -242,12 +282,14 @@ class KWBDataConverter:
     
     def is_numeric(self, register: dict) -> bool:
         """Check if register contains numeric data."""
-        unit_value_table = register.get("unit_value_table", "")
-        
         # If it has a value table (enum mapping), it's not numeric
         if self.has_value_table(register):
             return False
-        
+
+        return self._is_numeric_unit(register.get("unit_value_table", ""))
+
+    def _is_numeric_unit(self, unit_value_table: str) -> bool:
+        """Check if a unit_value_table (known not to be a value table) denotes numeric data."""
         # If it has scaling (like "1/10°C"), it's numeric
         if re.match(r"1/\d+", unit_value_table):
             return True
@@ -348,26 +390,12 @@ class KWBDataConverter:
     def get_min_value(self, register: dict) -> float:
         """Get minimum value for numeric register."""
         data_type = register.get("type", register.get("unit", "u16"))
-        
-        if data_type == "s16":
-            return -32768.0
-        elif data_type in ["u16", "u32", "s32"]:
-            return 0.0
-        else:
-            return 0.0
+        return _MIN_VALUES.get(data_type, _DEFAULT_MIN_VALUE)
     
     def get_max_value(self, register: dict) -> float:
         """Get maximum value for numeric register."""
         data_type = register.get("type", register.get("unit", "u16"))
-        
-        if data_type == "u16":
-            return 65535.0
-        elif data_type == "s16":
-            return 32767.0
-        elif data_type in ["u32", "s32"]:
-            return 4294967295.0
-        else:
-            return 1000000.0
+        return _MAX_VALUES.get(data_type, _DEFAULT_MAX_VALUE)
     
     def get_step_value(self, register: dict) -> float:
         """Get step value for numeric register based on scaling."""
@@ -42,7 +42,8 @@ class KWBBaseEntity(CoordinatorEntity):
 
         # Set explicit entity_id to ensure device name prefix is included
         device_prefix = coordinator.sanitize_for_entity_id(coordinator.device_name_prefix)
-        register_name = coordinator.sanitize_for_entity_id(register["name"])
+        # Normalized registers carry their sanitized name; fall back for any other register dict
+        register_name = register.get("entity_id") or coordinator.sanitize_for_entity_id(register["name"])
         self.entity_id = f"{platform}.{device_prefix}_{register_name}"
 
         # Set device info
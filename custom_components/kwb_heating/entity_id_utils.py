@@ -0,0 +1,44 @@
+"""Entity ID utilities for KWB Heating integration."""
+from __future__ import annotations
+
+import functools
+import re
+
+# Characters allowed in the sanitized entity ID suffix
+_ENTITY_ID_ALLOWED = frozenset("abcdefghijklmnopqrstuvwxyz0123456789_")
+
+# Pre-compiled regex for entity ID sanitization (more efficient than chained replace)
+_ENTITY_ID_INVALID_CHARS = re.compile(r"[^a-z0-9_]")
+
+# Character replacements for entity ID sanitization
+_ENTITY_ID_REPLACEMENTS = str.maketrans({
+    " ": "_", ".": "_", "/": "_", "-": "_", ":": "_",
+    "ä": "ae", "ö": "oe", "ü": "ue", "ß": "ss",
+    "&": "and", "@": "at",
+    "(": "", ")": "", "#": "", "!": "", "?": "", ",": "", ";": "", "'": "", '"': "",
+})
+
+# Replacements plus deletion of every other disallowed Latin-1 character, so
+# a single translate pass yields a clean result for typical register names
+_ENTITY_ID_TRANSLATIONS = {
+    **{cp: None for cp in range(256) if chr(cp) not in _ENTITY_ID_ALLOWED},
+    **_ENTITY_ID_REPLACEMENTS,
+}
+
+
+@functools.lru_cache(maxsize=8192)
+def sanitize_for_entity_id(text: str) -> str:
+    """Sanitize text for use in entity IDs.
+
+    Uses pre-compiled translation table and regex for better performance.
+    Results are memoized since register names repeat across equipment
+    instances and languages.
+    """
+    # Apply character translations and drop invalid Latin-1 characters
+    result = text.lower().translate(_ENTITY_ID_TRANSLATIONS)
+    # Only characters beyond Latin-1 can survive the translation
+    if not result.isascii():
+        result = _ENTITY_ID_INVALID_CHARS.sub("", result)
+    # Collapse multiple underscores and strip leading/trailing underscores;
+    # split() yields empty strings for both, which filter() drops
+    return "_".join(filter(None, result.split("_")))
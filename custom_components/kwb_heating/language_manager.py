@@ -2,12 +2,15 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
+import os
 from pathlib import Path
 from typing import Any
 
-import aiofiles
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 from .version_manager import VersionManager
 
@@ -49,9 +52,8 @@ class LanguageManager:
         """Load language configuration from file asynchronously."""
         try:
             if self.language_config_path.exists():
-                async with aiofiles.open(self.language_config_path, 'r', encoding='utf-8') as f:
-                    content = await f.read()
-                    self.language_config = json.loads(content)
+                content = await asyncio.to_thread(self.language_config_path.read_bytes)
+                self.language_config = _json_loads(content)
 
                 language_detection = self.language_config.get("language_detection", {})
                 self.use_ha_locale = language_detection.get("use_ha_locale", True)
@@ -170,11 +172,35 @@ class LanguageAwareConfigLoader:
         self.version_manager = version_manager
         self.language_manager = language_manager
 
-    def _read_file_sync(self, file_path: Path) -> str:
-        """Read file synchronously for executor."""
-        with open(file_path, 'r', encoding='utf-8') as f:
+    def _read_file_sync(self, file_path: Path) -> bytes:
+        """Read raw file bytes synchronously for executor (decoded by the JSON parser)."""
+        with open(file_path, 'rb') as f:
             return f.read()
 
+    def _read_directory_sync(self, directory_path: Path) -> dict[str, bytes] | None:
+        """Read all JSON files of a directory in one executor job.
+
+        A single scandir pass replaces the separate exists/is_dir/glob calls.
+
+        Returns:
+            Raw file bytes keyed by filename without extension, or None if the
+            directory does not exist
+        """
+        try:
+            entries = list(os.scandir(directory_path))
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+
+        contents = {}
+        for entry in entries:
+            if not entry.name.endswith(".json") or not entry.is_file():
+                continue
+            try:
+                contents[entry.name[:-5]] = self._read_file_sync(Path(entry.path))
+            except OSError as exc:
+                _LOGGER.error("Error loading file %s: %s", entry.path, exc)
+        return contents
+
     async def load_config(
         self,
         config_type: str,
@@ -223,7 +249,7 @@ class LanguageAwareConfigLoader:
             # Read file asynchronously
             loop = asyncio.get_event_loop()
             content = await loop.run_in_executor(None, self._read_file_sync, file_path)
-            config_data = json.loads(content)
+            config_data = _json_loads(content)
 
             _LOGGER.debug("Loaded %s config from %s", config_type, file_path)
             return config_data
@@ -242,26 +268,20 @@ class LanguageAwareConfigLoader:
             Dictionary with filename (without .json) as keys
         """
         try:
-            if not directory_path.exists() or not directory_path.is_dir():
+            loop = asyncio.get_event_loop()
+            contents = await loop.run_in_executor(None, self._read_directory_sync, directory_path)
+            if contents is None:
                 _LOGGER.warning("Config directory not found: %s", directory_path)
                 return {}
 
             config_data = {}
-            json_files = list(directory_path.glob("*.json"))
-
-            for file_path in json_files:
+            for key, content in contents.items():
                 try:
-                    loop = asyncio.get_event_loop()
-                    content = await loop.run_in_executor(None, self._read_file_sync, file_path)
-                    data = json.loads(content)
-
                     # Use filename without extension as key
-                    key = file_path.stem
-                    config_data[key] = data
-
-                    _LOGGER.debug("Loaded config file: %s", file_path)
+                    config_data[key] = _json_loads(content)
+                    _LOGGER.debug("Loaded config file: %s", directory_path / f"{key}.json")
                 except Exception as exc:
-                    _LOGGER.error("Error loading file %s: %s", file_path, exc)
+                    _LOGGER.error("Error loading file %s: %s", directory_path / f"{key}.json", exc)
                     continue
 
             return config_data
@@ -311,9 +331,8 @@ class LanguageAwareConfigLoader:
         Returns:
             Dictionary with all configuration data
         """
-        all_configs = {}
-
-        # Load all config types
+        # Load all config types; they are independent, so their file reads
+        # overlap in the executor
         config_types = [
             "universal_registers",
             "value_tables",
@@ -322,7 +341,7 @@ class LanguageAwareConfigLoader:
             "equipment",
         ]
 
-        for config_type in config_types:
-            all_configs[config_type] = await self.load_config(config_type, version, language)
-
-        return all_configs
+        results = await asyncio.gather(
+            *(self.load_config(config_type, version, language) for config_type in config_types)
+        )
+        return dict(zip(config_types, results))
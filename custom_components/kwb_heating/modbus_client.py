@@ -7,9 +7,6 @@ from typing import Any
 import inspect
 
 from pymodbus.client import AsyncModbusTcpClient
-from pymodbus.exceptions import ModbusException
-
-from .const import MODBUS_FUNCTION_CODES, ERROR_CONNECTION, ERROR_TIMEOUT
 
 _LOGGER = logging.getLogger(__name__)
 
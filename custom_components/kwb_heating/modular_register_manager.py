@@ -6,7 +6,10 @@ import logging
 from pathlib import Path
 from typing import Any
 
-from .const import DATA_TYPES
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -38,29 +41,25 @@ class ModularRegisterManager:
             # Load meta config
             meta_path = self.config_dir / "meta_config.json"
             if meta_path.exists():
-                with open(meta_path, 'r', encoding='utf-8') as f:
-                    self._meta_config = json.load(f)
+                self._meta_config = _json_loads(meta_path.read_bytes())
             
             # Load universal registers
             universal_path = self.config_dir / "universal_registers.json"
             if universal_path.exists():
-                with open(universal_path, 'r', encoding='utf-8') as f:
-                    universal_data = json.load(f)
-                    self._universal_registers = universal_data.get("universal_registers", [])
+                universal_data = _json_loads(universal_path.read_bytes())
+                self._universal_registers = universal_data.get("universal_registers", [])
             
             # Load value tables
             value_tables_path = self.config_dir / "value_tables.json"
             if value_tables_path.exists():
-                with open(value_tables_path, 'r', encoding='utf-8') as f:
-                    value_tables_data = json.load(f)
-                    self._value_tables = value_tables_data.get("value_tables", {})
+                value_tables_data = _json_loads(value_tables_path.read_bytes())
+                self._value_tables = value_tables_data.get("value_tables", {})
             
             # Load alarm codes (optional, on demand)
             alarm_codes_path = self.config_dir / "alarm_codes.json"
             if alarm_codes_path.exists():
-                with open(alarm_codes_path, 'r', encoding='utf-8') as f:
-                    alarm_data = json.load(f)
-                    self._alarm_codes = alarm_data.get("alarm_codes", [])
+                alarm_data = _json_loads(alarm_codes_path.read_bytes())
+                self._alarm_codes = alarm_data.get("alarm_codes", [])
             
             _LOGGER.info("Loaded modular KWB configuration: %d universal registers, %d value tables", 
                         len(self._universal_registers), len(self._value_tables))
@@ -96,12 +95,11 @@ class ModularRegisterManager:
         
         device_path = self.config_dir / "devices" / filename
         try:
-            with open(device_path, 'r', encoding='utf-8') as f:
-                device_data = json.load(f)
-                registers = device_data.get("registers", [])
-                self._device_cache[device_type] = registers
-                _LOGGER.info("Loaded %d registers for device type %s", len(registers), device_type)
-                return registers
+            device_data = _json_loads(device_path.read_bytes())
+            registers = device_data.get("registers", [])
+            self._device_cache[device_type] = registers
+            _LOGGER.info("Loaded %d registers for device type %s", len(registers), device_type)
+            return registers
                 
         except FileNotFoundError:
             _LOGGER.warning("Device configuration not found: %s", device_path)
@@ -137,12 +135,11 @@ class ModularRegisterManager:
         
         equipment_path = self.config_dir / "equipment" / filename
         try:
-            with open(equipment_path, 'r', encoding='utf-8') as f:
-                equipment_data = json.load(f)
-                registers = equipment_data.get("registers", [])
-                self._equipment_cache[equipment_type] = registers
-                _LOGGER.info("Loaded %d registers for equipment type %s", len(registers), equipment_type)
-                return registers
+            equipment_data = _json_loads(equipment_path.read_bytes())
+            registers = equipment_data.get("registers", [])
+            self._equipment_cache[equipment_type] = registers
+            _LOGGER.info("Loaded %d registers for equipment type %s", len(registers), equipment_type)
+            return registers
                 
         except FileNotFoundError:
             _LOGGER.warning("Equipment configuration not found: %s", equipment_path)
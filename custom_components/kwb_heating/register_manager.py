@@ -7,7 +7,10 @@ from pathlib import Path
 from typing import Any
 import asyncio
 
-from .const import DATA_TYPES
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -34,20 +37,19 @@ class RegisterManager:
         # This is a compromise - the file is read synchronously but handled gracefully
         self._load_configuration_sync()
 
-    def _read_file_sync(self) -> str:
-        """Synchronous file reading for executor."""
-        with open(self.config_path, 'r', encoding='utf-8') as f:
+    def _read_file_sync(self) -> bytes:
+        """Synchronous file reading for executor (raw bytes, decoded by the JSON parser)."""
+        with open(self.config_path, 'rb') as f:
             return f.read()
 
     def _load_configuration_sync(self) -> None:
         """Load configuration synchronously (fallback for __init__)."""
         _LOGGER.info("Loading KWB configuration from: %s", self.config_path)
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = self._read_file_sync()
                 
-            _LOGGER.info("Parsing JSON content (%d characters)...", len(content))
-            self._config = json.loads(content)
+            _LOGGER.info("Parsing JSON content (%d bytes)...", len(content))
+            self._config = _json_loads(content)
             
             _LOGGER.info("Successfully loaded JSON config")
             
@@ -94,8 +96,8 @@ class RegisterManager:
             loop = asyncio.get_event_loop()
             content = await loop.run_in_executor(None, self._read_file_sync)
             
-            _LOGGER.info("Parsing JSON content (%d characters)...", len(content))
-            self._config = json.loads(content)
+            _LOGGER.info("Parsing JSON content (%d bytes)...", len(content))
+            self._config = _json_loads(content)
             
             _LOGGER.info("Successfully loaded JSON config")
             
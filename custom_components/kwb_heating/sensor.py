@@ -2,6 +2,8 @@
 from __future__ import annotations
 
 import logging
+import re
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any
 
@@ -19,23 +21,24 @@ from homeassistant.helpers.restore_state import RestoreEntity
 
 from .const import DOMAIN
 from .coordinator import KWBDataUpdateCoordinator
+from .data_conversion import KWBDataConverter
 from .entity import KWBBaseEntity
 from .icon_utils import get_entity_icon
 
 # Device types that support firewood (Stückholz)
-FIREWOOD_DEVICE_TYPES = [
+FIREWOOD_DEVICE_TYPES = frozenset({
     "KWB CF 1",
     "KWB CF 1.5",
     "KWB CF 2",
     "KWB Combifire",
     "KWB Multifire",
-]
+})
 
 # Modbus address for firewood boiler status (Status Stückholz)
 FIREWOOD_STATUS_ADDRESS = 8212
 
 # Boiler status values indicating active firewood operation (ksm_kesselstatus_anzeige_t)
-FIREWOOD_ACTIVE_VALUES = [
+FIREWOOD_ACTIVE_VALUES = frozenset({
     36,  # Anheizen
     37,  # Warten Zündanf.
     38,  # Warten Zündfreig.
@@ -43,28 +46,79 @@ FIREWOOD_ACTIVE_VALUES = [
     40,  # Zünden
     41,  # Heizen
     42,  # Feuerhaltung
-]
+})
+
+
+@dataclass(frozen=True, slots=True)
+class _FirewoodTranslation:
+    """Language-specific names for the Last Firewood Fire sensor."""
+
+    name: str
+    entity_id_suffix: str
+    attr_firewood_active: str
+    attr_boiler_status_raw: str
+    attr_boiler_status: str
+
 
 # Translations for the Last Firewood Fire sensor
 FIREWOOD_SENSOR_TRANSLATIONS = {
-    "de": {
-        "name": "Letztes Stückholzfeuer",
-        "entity_id_suffix": "letztes_stueckholzfeuer",
-        "attr_firewood_active": "stueckholz_aktiv",
-        "attr_boiler_status_raw": "kesselstatus_rohwert",
-        "attr_boiler_status": "kesselstatus",
-    },
-    "en": {
-        "name": "Last Firewood Fire",
-        "entity_id_suffix": "last_firewood_fire",
-        "attr_firewood_active": "firewood_currently_active",
-        "attr_boiler_status_raw": "boiler_status_raw",
-        "attr_boiler_status": "boiler_status",
-    },
+    "de": _FirewoodTranslation(
+        name="Letztes Stückholzfeuer",
+        entity_id_suffix="letztes_stueckholzfeuer",
+        attr_firewood_active="stueckholz_aktiv",
+        attr_boiler_status_raw="kesselstatus_rohwert",
+        attr_boiler_status="kesselstatus",
+    ),
+    "en": _FirewoodTranslation(
+        name="Last Firewood Fire",
+        entity_id_suffix="last_firewood_fire",
+        attr_firewood_active="firewood_currently_active",
+        attr_boiler_status_raw="boiler_status_raw",
+        attr_boiler_status="boiler_status",
+    ),
 }
 
 _LOGGER = logging.getLogger(__name__)
 
+_UTC = timezone.utc
+
+# Register field holding the permission for each access level
+_ACCESS_LEVEL_KEYS = {"UserLevel": "user_level", "ExpertLevel": "expert_level"}
+
+# Permissions that make a register readable
+_READ_WRITE = frozenset({"read", "write"})
+
+# Keywords in a (lowercased) register name that mark its sensor as diagnostic
+_DIAGNOSTIC_KEYWORDS_RE = re.compile(r"version|revision|software|alarm|error|störung")
+
+
+@dataclass(frozen=True, slots=True)
+class _SensorSpec:
+    """Sensor entity settings derived from a register definition."""
+
+    unit: str | None
+    device_class: str | None
+    is_numeric: bool
+    has_value_table: bool
+    icon: str
+    is_diagnostic: bool
+
+
+def _get_sensor_spec(register: dict, converter: KWBDataConverter) -> _SensorSpec:
+    """Return the sensor settings of a register, computed once and memoised on it."""
+    spec = register.get("_sensor_spec")
+    if spec is None:
+        meta = converter.describe(register)
+        spec = register["_sensor_spec"] = _SensorSpec(
+            unit=meta.unit,
+            device_class=meta.device_class,
+            is_numeric=meta.is_numeric,
+            has_value_table=meta.has_value_table,
+            icon=get_entity_icon(register, "sensor"),
+            is_diagnostic=bool(_DIAGNOSTIC_KEYWORDS_RE.search(register["name"].lower())),
+        )
+    return spec
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -82,41 +136,43 @@ async def async_setup_entry(
     
     _LOGGER.debug("Processing %d registers for sensor entities", len(coordinator._registers) if coordinator._registers else 0)
     
+    # Access level is fixed for the whole setup: UserLevel or ExpertLevel
+    access_level = coordinator.access_level
+    access_key = _ACCESS_LEVEL_KEYS.get(access_level)
+    debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)
+    registers = coordinator._registers
+    columns = coordinator._register_columns
+
+    # Permission of each register at the current access level (none for unknown levels)
+    levels = columns[access_key] if access_key else [None] * len(registers)
+
     # Create sensor entities for all read-only registers and RW registers that should show values
-    for register in coordinator._registers:
+    for i, level in enumerate(levels):
         # Sensors are created for:
         # 1. Read-only registers (access="R")
         # 2. Read-write registers that have value tables (display values)
         # 3. Read-write registers that are diagnostic or informational
-        # Get access level and determine if this register should create a sensor
-        user_level = register.get("user_level", "")
-        expert_level = register.get("expert_level", "")
-        access_level = coordinator.access_level  # UserLevel or ExpertLevel
-        
         # Check if this register is accessible at the current access level
-        is_readable = False
-        if access_level == "UserLevel" and user_level in ["read", "write"]:
-            is_readable = True
-        elif access_level == "ExpertLevel" and expert_level in ["read", "write"]:
-            is_readable = True
+        is_readable = level in _READ_WRITE
         
-        _LOGGER.debug("Register %s: user_level=%s, expert_level=%s, current_access=%s, readable=%s", 
-                      register.get("name", "Unknown"), user_level, expert_level, access_level, is_readable)
+        if debug_enabled:
+            register = registers[i]
+            _LOGGER.debug("Register %s: user_level=%s, expert_level=%s, current_access=%s, readable=%s", 
+                          register.get("name", "Unknown"), register.get("user_level", ""),
+                          register.get("expert_level", ""), access_level, is_readable)
         
         # Create sensor for readable registers
         if is_readable:
-            _LOGGER.debug("Creating sensor for register: %s", register.get("name", "Unknown"))
+            register = registers[i]
+            if debug_enabled:
+                _LOGGER.debug("Creating sensor for register: %s", register.get("name", "Unknown"))
             entities.append(KWBSensor(coordinator, register))
     
     # Add computed sensor for firewood devices: "Last Firewood Fire"
     device_type = coordinator.config.get("device_type", "")
     if device_type in FIREWOOD_DEVICE_TYPES:
         # Check if the firewood status register is available
-        has_firewood_status = any(
-            reg.get("starting_address") == FIREWOOD_STATUS_ADDRESS
-            for reg in coordinator._registers
-        )
-        if has_firewood_status:
+        if FIREWOOD_STATUS_ADDRESS in coordinator.register_addresses:
             _LOGGER.info("Adding 'Last Firewood Fire' sensor for device type: %s", device_type)
             entities.append(KWBLastFirewoodFireSensor(coordinator))
         else:
@@ -129,6 +185,9 @@ async def async_setup_entry(
 class KWBSensor(KWBBaseEntity, SensorEntity):
     """Representation of a KWB heating system sensor."""
 
+    # HA base classes keep their __dict__; our own per-entity state lives in slots
+    __slots__ = ("_static_attributes",)
+
     def __init__(
         self,
         coordinator: KWBDataUpdateCoordinator,
@@ -142,77 +201,80 @@ class KWBSensor(KWBBaseEntity, SensorEntity):
 
     def _configure_sensor(self) -> None:
         """Configure sensor properties based on register definition."""
-        # Use data converter for unit and device class
-        unit = self.coordinator.data_converter.get_unit(self._register)
-        device_class = self.coordinator.data_converter.get_device_class(self._register)
+        # Unit, device class and icon only depend on the register - reuse them across reloads
+        spec = _get_sensor_spec(self._register, self.coordinator.data_converter)
         
-        if unit:
-            self._attr_native_unit_of_measurement = unit
+        if spec.unit:
+            self._attr_native_unit_of_measurement = spec.unit
         
-        if device_class:
-            self._attr_device_class = device_class
+        if spec.device_class:
+            self._attr_device_class = spec.device_class
             
         # Set state class ONLY for truly numeric values (no value tables)
-        if (self.coordinator.data_converter.is_numeric(self._register) and 
-            not self.coordinator.data_converter.has_value_table(self._register)):
+        if spec.is_numeric and not spec.has_value_table:
             self._attr_state_class = SensorStateClass.MEASUREMENT
         
         # Set icon based on register definition
-        self._attr_icon = get_entity_icon(self._register, "sensor")
+        self._attr_icon = spec.icon
         
         # Set entity category based on register properties
-        name_lower = self._register["name"].lower()
-        if any(keyword in name_lower for keyword in ["version", "revision", "software"]):
-            self._attr_entity_category = EntityCategory.DIAGNOSTIC
-        elif any(keyword in name_lower for keyword in ["alarm", "error", "störung"]):
+        if spec.is_diagnostic:
             self._attr_entity_category = EntityCategory.DIAGNOSTIC
 
-    @property
-    def native_value(self) -> Any:
-        """Return the state of the sensor."""
-        if self.coordinator.data and self._address in self.coordinator.data:
-            register_data = self.coordinator.data[self._address]
-            
-            # Use display value if available (from value table)
-            if "display_value" in register_data:
-                return register_data["display_value"]
-                
-            # Otherwise use converted value
-            return register_data.get("value")
-        
-        return None
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional state attributes."""
-        if not self.coordinator.data or self._address not in self.coordinator.data:
-            return {}
-        
-        register_data = self.coordinator.data[self._address]
-        
-        attributes = {
+        # Register-derived state attributes never change - build them once
+        # (keep only snake_case attributes for consistency)
+        static_attributes = {
             "register_address": self._address,
             "register_type": self._register.get("type"),
             "data_type": self._register.get("data_type"),
-            "raw_value": register_data.get("raw_value"),
         }
 
-        # Keep only snake_case attributes for consistency
-        
         # Add register description if available
         if self._register.get("description"):
-            attributes["description"] = self._register["description"]
+            static_attributes["description"] = self._register["description"]
         
         # Add access level info
         if self._register.get("access_level"):
-            attributes["access_level"] = self._register["access_level"]
+            static_attributes["access_level"] = self._register["access_level"]
         
         # Add min/max values if available
         if self._register.get("min"):
-            attributes["min_value"] = self._register["min"]
+            static_attributes["min_value"] = self._register["min"]
         if self._register.get("max"):
-            attributes["max_value"] = self._register["max"]
+            static_attributes["max_value"] = self._register["max"]
+
+        self._static_attributes = static_attributes
+
+    def _get_register_data(self) -> dict[str, Any] | None:
+        """Return this sensor's entry in the coordinator data, or None if missing."""
+        data = self.coordinator.data
+        return data.get(self._address) if data else None
+
+    @property
+    def native_value(self) -> Any:
+        """Return the state of the sensor."""
+        # Hottest property - inline the lookup instead of calling _get_register_data
+        data = self.coordinator.data
+        register_data = data.get(self._address) if data else None
+        if register_data is None:
+            return None
+
+        # Use display value if available (from value table)
+        if "display_value" in register_data:
+            return register_data["display_value"]
+            
+        # Otherwise use converted value
+        return register_data.get("value")
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return additional state attributes."""
+        register_data = self._get_register_data()
+        if register_data is None:
+            return {}
         
+        attributes = self._static_attributes.copy()
+        attributes["raw_value"] = register_data.get("raw_value")
         return attributes
 
     @property
@@ -220,14 +282,15 @@ class KWBSensor(KWBBaseEntity, SensorEntity):
         """Return True if entity is available."""
         return (
             self.coordinator.last_update_success
-            and self.coordinator.data is not None
-            and self._address in self.coordinator.data
+            and self._get_register_data() is not None
         )
 
 
 class KWBLastFirewoodFireSensor(CoordinatorEntity, RestoreEntity, SensorEntity):
     """Sensor that tracks when the last firewood fire was active."""
 
+    __slots__ = ("_last_firewood_time", "_was_firewood_active", "_language", "_last_written_state")
+
     def __init__(self, coordinator: KWBDataUpdateCoordinator) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
@@ -236,6 +299,9 @@ class KWBLastFirewoodFireSensor(CoordinatorEntity, RestoreEntity, SensorEntity):
         self._last_firewood_time: datetime | None = None
         self._was_firewood_active: bool = False
 
+        # Inputs of the last written state, to skip writes when nothing changed
+        self._last_written_state: tuple | None = None
+
         # Get language from register manager (default to "de" if not available)
         language = "de"
         if hasattr(coordinator, 'register_manager') and coordinator.register_manager:
@@ -248,7 +314,7 @@ class KWBLastFirewoodFireSensor(CoordinatorEntity, RestoreEntity, SensorEntity):
 
         # Set entity attributes
         device_prefix = coordinator.device_name_prefix
-        self._attr_name = f"{device_prefix} {translations['name']}"
+        self._attr_name = f"{device_prefix} {translations.name}"
 
         # Generate unique ID (always use English for consistency)
         device_identifier = f"{coordinator.host}_{coordinator.slave_id}"
@@ -256,7 +322,7 @@ class KWBLastFirewoodFireSensor(CoordinatorEntity, RestoreEntity, SensorEntity):
         self._attr_unique_id = f"kwb_heating_{device_identifier}_{device_prefix_id}_last_firewood_fire"
 
         # Set explicit entity_id using language-specific suffix
-        self._attr_entity_id = f"sensor.{device_prefix_id}_{translations['entity_id_suffix']}"
+        self._attr_entity_id = f"sensor.{device_prefix_id}_{translations.entity_id_suffix}"
 
         # Set device info
         self._attr_device_info = coordinator.device_info
@@ -278,7 +344,7 @@ class KWBLastFirewoodFireSensor(CoordinatorEntity, RestoreEntity, SensorEntity):
                 try:
                     restored = datetime.fromisoformat(last_state.state)
                     if restored.tzinfo is None:
-                        restored = restored.replace(tzinfo=timezone.utc)
+                        restored = restored.replace(tzinfo=_UTC)
                     self._last_firewood_time = restored
                     _LOGGER.debug(
                         "Restored last firewood fire timestamp: %s",
@@ -290,21 +356,30 @@ class KWBLastFirewoodFireSensor(CoordinatorEntity, RestoreEntity, SensorEntity):
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        if self.coordinator.data and FIREWOOD_STATUS_ADDRESS in self.coordinator.data:
-            register_data = self.coordinator.data[FIREWOOD_STATUS_ADDRESS]
+        raw_value = None
+        display_value = None
+        data = self.coordinator.data
+        register_data = data.get(FIREWOOD_STATUS_ADDRESS) if data else None
+        if register_data is not None:
             raw_value = register_data.get("raw_value")
+            display_value = register_data.get("display_value")
 
             if raw_value is not None:
                 is_firewood_active = raw_value in FIREWOOD_ACTIVE_VALUES
 
                 # Update timestamp when firewood becomes active or stays active
                 if is_firewood_active:
-                    self._last_firewood_time = datetime.now(tz=timezone.utc)
+                    self._last_firewood_time = datetime.now(_UTC)
                     if not self._was_firewood_active:
                         _LOGGER.info("Firewood fire started at %s", self._last_firewood_time)
 
                 self._was_firewood_active = is_firewood_active
 
+        # State and attributes only depend on these - skip the write if none changed
+        state = (self._last_firewood_time, raw_value, display_value, self.available)
+        if state == self._last_written_state:
+            return
+        self._last_written_state = state
         self.async_write_ha_state()
 
     @property
@@ -322,17 +397,18 @@ class KWBLastFirewoodFireSensor(CoordinatorEntity, RestoreEntity, SensorEntity):
             self._language, FIREWOOD_SENSOR_TRANSLATIONS["en"]
         )
 
-        if self.coordinator.data and FIREWOOD_STATUS_ADDRESS in self.coordinator.data:
-            register_data = self.coordinator.data[FIREWOOD_STATUS_ADDRESS]
+        data = self.coordinator.data
+        register_data = data.get(FIREWOOD_STATUS_ADDRESS) if data else None
+        if register_data is not None:
             raw_value = register_data.get("raw_value")
 
             if raw_value is not None:
-                attributes[translations["attr_firewood_active"]] = raw_value in FIREWOOD_ACTIVE_VALUES
-                attributes[translations["attr_boiler_status_raw"]] = raw_value
+                attributes[translations.attr_firewood_active] = raw_value in FIREWOOD_ACTIVE_VALUES
+                attributes[translations.attr_boiler_status_raw] = raw_value
 
                 # Add display value if available
                 if "display_value" in register_data:
-                    attributes[translations["attr_boiler_status"]] = register_data["display_value"]
+                    attributes[translations.attr_boiler_status] = register_data["display_value"]
 
         return attributes
 
@@ -2,16 +2,71 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import functools
 import logging
 import re
+import weakref
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
-import aiofiles
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 _LOGGER = logging.getLogger(__name__)
 
+# Version mapping files parsed once per process and shared read-only by all managers
+_SHARED_CONFIGS: dict[Path, Mapping[str, Any]] = {}
+# Locks guarding the first load, one per event loop (an asyncio.Lock is bound to a single loop)
+_SHARED_CONFIGS_LOCKS: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, asyncio.Lock
+] = weakref.WeakKeyDictionary()
+
+# Matches a "major.minor.patch" version number
+_VERSION_RE = re.compile(r'(\d+)\.(\d+)\.(\d+)')
+
+
+@functools.lru_cache(maxsize=32)
+def _match_version_string(version_str: str) -> str | None:
+    """Extract a normalized "major.minor.patch" string, or None if there is none."""
+    match = _VERSION_RE.match(version_str)
+    if match:
+        return f"{match.group(1)}.{match.group(2)}.{match.group(3)}"
+    return None
+
+
+def _read_json_sync(path: Path) -> Any:
+    """Read and parse a JSON file (runs in executor)."""
+    with open(path, 'rb') as f:
+        return _json_loads(f.read())
+
+
+def _shared_configs_lock() -> asyncio.Lock:
+    """Return the shared config lock of the running event loop, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    lock = _SHARED_CONFIGS_LOCKS.get(loop)
+    if lock is None:
+        lock = _SHARED_CONFIGS_LOCKS[loop] = asyncio.Lock()
+    return lock
+
+
+async def _get_shared_config(path: Path) -> Mapping[str, Any] | None:
+    """Load a version mapping file once per process, or None if it does not exist."""
+    async with _shared_configs_lock():
+        config = _SHARED_CONFIGS.get(path)
+        if config is None:
+            if not path.exists():
+                return None
+            # A single executor hop; the file is tiny and read once per process
+            config = await asyncio.to_thread(_read_json_sync, path)
+            config["supported_versions"] = MappingProxyType(config.get("supported_versions", {}))
+            config = MappingProxyType(config)
+            _SHARED_CONFIGS[path] = config
+        return config
+
 
 class VersionManager:
     """Manages version detection and configuration path resolution for KWB heating systems."""
@@ -28,7 +83,14 @@ class VersionManager:
 
         self.config_base_path = Path(config_base_path)
         self.version_mapping_path = self.config_base_path / "version_mapping.json"
-        self.version_mapping: dict[str, Any] = {}
+        self.version_mapping: Mapping[str, Any] = {}
+        # Supported versions with their parsed (major, minor, patch) numbers
+        self._parsed_versions: list[tuple[str, tuple[int, ...]]] = []
+        # Closest supported version per requested version
+        self._closest_cache: dict[str, str] = {}
+        # Resolved config paths and their existence per (version, language)
+        self._path_cache: dict[tuple[str, str], Path] = {}
+        self._exists_cache: dict[tuple[str, str], bool] = {}
         self.fallback_strategy = "closest_match"
         self.default_version = "22.7.1"
         self._initialized = False
@@ -42,25 +104,27 @@ class VersionManager:
             return
 
         await self._async_load_version_mapping()
+        # Paths resolved against the default mapping may differ from the loaded one
+        self._path_cache.clear()
+        self._exists_cache.clear()
         self._initialized = True
 
     async def _async_load_version_mapping(self) -> None:
         """Load version mapping from configuration file asynchronously."""
         try:
-            if self.version_mapping_path.exists():
-                async with aiofiles.open(self.version_mapping_path, 'r', encoding='utf-8') as f:
-                    content = await f.read()
-                    config = json.loads(content)
-                    self.version_mapping = config.get("supported_versions", {})
-
-                    fallback_rules = config.get("fallback_rules", {})
-                    self.fallback_strategy = fallback_rules.get("strategy", "closest_match")
-                    self.default_version = fallback_rules.get("default_version", "24.7.1")
-
-                    _LOGGER.info(
-                        "Loaded version mapping with %d supported versions",
-                        len(self.version_mapping)
-                    )
+            config = await _get_shared_config(self.version_mapping_path)
+            if config is not None:
+                self.version_mapping = config["supported_versions"]
+
+                fallback_rules = config.get("fallback_rules", {})
+                self.fallback_strategy = fallback_rules.get("strategy", "closest_match")
+                self.default_version = fallback_rules.get("default_version", "24.7.1")
+                self._parse_supported_versions()
+
+                _LOGGER.info(
+                    "Loaded version mapping with %d supported versions",
+                    len(self.version_mapping)
+                )
             else:
                 _LOGGER.debug(
                     "Version mapping file not found at %s, using defaults",
@@ -97,6 +161,18 @@ class VersionManager:
                 }
             }
         }
+        self._parse_supported_versions()
+
+    def _parse_supported_versions(self) -> None:
+        """Parse supported version strings once for closest-version lookups."""
+        parsed_versions = []
+        for version in self.version_mapping:
+            try:
+                parsed_versions.append((version, tuple(int(x) for x in version.split('.'))))
+            except ValueError:
+                _LOGGER.warning("Ignoring unparsable supported version: %s", version)
+        self._parsed_versions = parsed_versions
+        self._closest_cache = {}
 
     def parse_version(self, version_raw: int | str) -> str:
         """Parse raw version value into normalized version string.
@@ -116,14 +192,13 @@ class VersionManager:
             return f"{major}.7.1"
 
         if isinstance(version_raw, str):
-            # Clean up version string (remove 'V' prefix, extra spaces, etc.)
-            version_str = version_raw.strip().upper()
-            version_str = version_str.replace('V', '').replace('v', '')
+            # Clean up version string (remove 'V' prefix and extra spaces)
+            version_str = version_raw.strip().lstrip('vV')
 
             # Try to extract version numbers
-            match = re.match(r'(\d+)\.(\d+)\.(\d+)', version_str)
-            if match:
-                return f"{match.group(1)}.{match.group(2)}.{match.group(3)}"
+            version = _match_version_string(version_str)
+            if version:
+                return version
 
         _LOGGER.warning("Could not parse version: %s", version_raw)
         return self.default_version
@@ -140,33 +215,30 @@ class VersionManager:
         if target_version in self.version_mapping:
             return target_version
 
-        supported_versions = list(self.version_mapping.keys())
-        if not supported_versions:
+        cached_version = self._closest_cache.get(target_version)
+        if cached_version is not None:
+            return cached_version
+
+        if not self._parsed_versions:
             return self.default_version
 
         # Parse version numbers for comparison
         try:
-            target_parts = [int(x) for x in target_version.split('.')]
+            t0, t1, t2 = (int(x) for x in target_version.split('.')[:3])
 
             # Find closest version by comparing major, minor, patch
-            closest_version = None
-            min_distance = float('inf')
-
-            for version in supported_versions:
-                version_parts = [int(x) for x in version.split('.')]
-
-                # Calculate distance (weighted: major > minor > patch)
-                distance = (
-                    abs(target_parts[0] - version_parts[0]) * 10000 +
-                    abs(target_parts[1] - version_parts[1]) * 100 +
-                    abs(target_parts[2] - version_parts[2])
-                )
-
-                if distance < min_distance:
-                    min_distance = distance
-                    closest_version = version
+            # (weighted distance: major > minor > patch; first version wins on ties)
+            closest_version, _ = min(
+                self._parsed_versions,
+                key=lambda item: (
+                    abs(t0 - item[1][0]) * 10000 +
+                    abs(t1 - item[1][1]) * 100 +
+                    abs(t2 - item[1][2])
+                ),
+            )
 
-            return closest_version or self.default_version
+            self._closest_cache[target_version] = closest_version
+            return closest_version
 
         except (ValueError, IndexError) as exc:
             _LOGGER.warning("Error finding closest version for %s: %s", target_version, exc)
@@ -182,12 +254,18 @@ class VersionManager:
         Returns:
             Path to configuration directory
         """
-        # Normalize version if needed
-        if version not in self.version_mapping:
+        cache_key = (version, language)
+        cached_path = self._path_cache.get(cache_key)
+        if cached_path is not None:
+            return cached_path
+
+        # Normalize version if needed (known versions skip the closest-version search)
+        version_info = self.version_mapping.get(version)
+        if version_info is None:
             version = self.get_closest_version(version)
             _LOGGER.info("Using closest version %s for requested version", version)
+            version_info = self.version_mapping.get(version, {})
 
-        version_info = self.version_mapping.get(version, {})
         config_path = version_info.get("config_path", f"versions/v{version}")
 
         # Check if language is supported
@@ -200,6 +278,7 @@ class VersionManager:
             language = supported_languages[0]
 
         full_path = self.config_base_path / config_path / language
+        self._path_cache[cache_key] = full_path
         return full_path
 
     def get_supported_versions(self) -> list[str]:
@@ -219,10 +298,10 @@ class VersionManager:
         Returns:
             List of language codes
         """
-        if version not in self.version_mapping:
-            version = self.get_closest_version(version)
+        version_info = self.version_mapping.get(version)
+        if version_info is None:
+            version_info = self.version_mapping.get(self.get_closest_version(version), {})
 
-        version_info = self.version_mapping.get(version, {})
         return version_info.get("supported_languages", ["de", "en"])
 
     def get_version_register_address(self, version: str | None = None) -> int:
@@ -250,8 +329,13 @@ class VersionManager:
         Returns:
             True if configuration directory exists
         """
-        config_path = self.get_config_path(version, language)
-        return config_path.exists() and config_path.is_dir()
+        cache_key = (version, language)
+        exists = self._exists_cache.get(cache_key)
+        if exists is None:
+            # is_dir() is False for missing paths, so one stat call is enough
+            exists = self.get_config_path(version, language).is_dir()
+            self._exists_cache[cache_key] = exists
+        return exists
 
     async def detect_version(self, modbus_client) -> str:
         """Detect software version from device.
@@ -291,7 +375,8 @@ class VersionManager:
         Returns:
             Dictionary with version information
         """
-        if version not in self.version_mapping:
-            version = self.get_closest_version(version)
+        version_info = self.version_mapping.get(version)
+        if version_info is None:
+            version_info = self.version_mapping.get(self.get_closest_version(version), {})
 
-        return self.version_mapping.get(version, {})
+        return version_info
@@ -1,10 +1,15 @@
 #!/usr/bin/env python3
 """Convert KWB ModbusInfo Excel files to JSON configuration format."""
 
+import functools
+import hashlib
 import json
 import logging
+import os
 import re
 import sys
+import traceback
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -14,9 +19,49 @@ except ImportError:
     print("Error: openpyxl library is required. Install with: pip install openpyxl")
     sys.exit(1)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 logger = logging.getLogger(__name__)
 
+# ModbusInfo-{language}-V{version}.xlsx
+_FILENAME_RE = re.compile(r'ModbusInfo-(\w+)-V(\d+\.\d+\.\d+)\.xlsx', re.IGNORECASE)
+
+# Content hashes of already converted workbooks, stored in the output directory
+_CACHE_FILENAME = ".conversion_cache.json"
+
+
+def _file_digest(path: Path, prefix: bytes = b"") -> str:
+    """Return a content hash of the given file, optionally mixed with a fixed-length prefix."""
+    return hashlib.blake2b(prefix + path.read_bytes(), digest_size=16).hexdigest()
+
+
+def _write_json(path: Path, data: Any) -> None:
+    """Write data as 2-space indented UTF-8 JSON.
+
+    Uses orjson when available (serialized in C), otherwise falls back to the
+    standard library. The two can format some values differently, e.g. small
+    floats (0.00001 vs 1e-05) or NaN (null vs NaN).
+    """
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def _convert_worker(converter: "ModbusInfoConverter", xlsx_file: Path) -> bool:
+    """Convert a single workbook in a worker process."""
+    try:
+        return converter.convert_file(xlsx_file)
+    except Exception as exc:
+        logger.error("Error converting %s: %s", xlsx_file.name, exc)
+        traceback.print_exc()
+        return False
+
 
 class ModbusInfoConverter:
     """Converts ModbusInfo Excel files to JSON configuration."""
@@ -46,9 +91,18 @@ class ModbusInfoConverter:
         "Übergabestation": "Transfer station",
     }
 
+    # Equipment sheets to look for, German names first
+    ALL_EQUIPMENT_SHEETS = (*EQUIPMENT_SHEETS.keys(), *EQUIPMENT_SHEETS.values())
+
     ALARMS_SHEET = "Alarms"
     VALUE_TABLES_SHEET = "ValueTables"
 
+    # Register sheet columns consumed by normalize_register
+    REGISTER_COLUMNS = frozenset({
+        "StartingAddress", "Name", "Index", "Functions", "Type", "UserLevel", "ExpertLevel",
+        "Unit/ValueTable", "Min", "Max", "NumberOfRegisters", "ID", "Parameter",
+    })
+
     # Use consistent English filenames for equipment
     EQUIPMENT_FILE_MAP = {
         "Heizkreise": "heating_circuits.json",
@@ -90,7 +144,7 @@ class ModbusInfoConverter:
 
     def parse_filename(self, filename: str) -> dict[str, str]:
         """Parse ModbusInfo filename to extract version and language."""
-        match = re.match(r'ModbusInfo-(\w+)-V(\d+\.\d+\.\d+)\.xlsx', filename, re.IGNORECASE)
+        match = _FILENAME_RE.match(filename)
         if match:
             language = match.group(1).lower()
             version = match.group(2)
@@ -99,24 +153,29 @@ class ModbusInfoConverter:
 
     def read_register_sheet(self, workbook: openpyxl.Workbook, sheet_name: str) -> list[dict]:
         """Read register data from Excel sheet."""
-        if sheet_name not in workbook.sheetnames:
+        # Look the sheet up directly; workbook.sheetnames rebuilds its list on every access
+        try:
+            sheet = workbook[sheet_name]
+        except KeyError:
             return []
 
-        sheet = workbook[sheet_name]
         registers = []
 
-        # Get header row
-        headers = [cell.value for cell in sheet[1]]
+        # Get header row; read-only sheets are streamed, so take it from the same row iterator
+        rows = sheet.iter_rows(values_only=True)
+        headers = next(rows, ())
 
-        # Read data rows (skip header)
-        for row in sheet.iter_rows(min_row=2, values_only=True):
-            if not any(row) or row[0] is None:  # Skip empty rows or rows without address
+        # Resolve the needed columns once per sheet instead of mapping every cell per row
+        columns = [(header, i) for i, header in enumerate(headers) if header in self.REGISTER_COLUMNS]
+
+        # Read data rows
+        for row in rows:
+            # Skip empty rows or rows without address; any() only runs for falsy addresses like 0
+            if not row or row[0] is None or not (row[0] or any(row)):
                 continue
 
-            row_dict = {}
-            for i, value in enumerate(row):
-                if i < len(headers) and headers[i]:
-                    row_dict[headers[i]] = value
+            row_len = len(row)
+            row_dict = {header: row[i] for header, i in columns if i < row_len}
 
             register = self.normalize_register(row_dict)
             if register:
@@ -141,12 +200,14 @@ class ModbusInfoConverter:
         if not index:
             return index
 
-        # Check each English prefix and replace with German equivalent
-        for en_prefix, de_prefix in self.INDEX_PREFIX_MAP.items():
-            if index.startswith(en_prefix + " "):
-                return de_prefix + index[len(en_prefix):]
+        # The prefix is everything before the first space - replace it with the
+        # German equivalent in a single lookup
+        prefix, separator, rest = index.partition(" ")
+        de_prefix = self.INDEX_PREFIX_MAP.get(prefix) if separator else None
+        if de_prefix is None:
+            return index
 
-        return index
+        return f"{de_prefix} {rest}"
 
     def normalize_register(self, data: dict) -> dict | None:
         """Normalize register data to standard format."""
@@ -155,48 +216,70 @@ class ModbusInfoConverter:
         if address is None:
             return None
 
-        # Build normalized register
+        # Registers need an address and a name
+        starting_address = int(address)
+        name = data.get("Name")
+        name = str(name).strip() if name else ""
+        if not starting_address or not name:
+            return None
+
+        # Build normalized register; fields are only added when non-empty
         register = {
-            "starting_address": int(address),
-            "name": str(data.get("Name", "")).strip() if data.get("Name") else "",
+            "starting_address": starting_address,
+            "name": name,
             "data_type": self._parse_function_code(data.get("Functions")),
-            "type": str(data.get("Type", "u16")).strip().lower(),
-            "user_level": self._parse_access_level(data.get("UserLevel")),
-            "expert_level": self._parse_access_level(data.get("ExpertLevel")),
         }
 
-        # Optional fields - normalize index to use German prefixes
-        if data.get("Index"):
-            register["index"] = self._normalize_index(str(data.get("Index")).strip())
-
-        if data.get("Unit/ValueTable"):
-            unit_or_table = str(data.get("Unit/ValueTable")).strip()
-            register["unit_value_table"] = unit_or_table
-
-        if data.get("Min") is not None:
-            register["min"] = data.get("Min")
-
-        if data.get("Max") is not None:
-            register["max"] = data.get("Max")
-
-        if data.get("NumberOfRegisters"):
-            num_regs = data.get("NumberOfRegisters")
-            if num_regs and num_regs != 1:
-                register["number_of_registers"] = int(num_regs)
-
-        if data.get("ID"):
-            register["id"] = str(data.get("ID"))
+        register_type = str(data.get("Type", "u16")).strip().lower()
+        if register_type:
+            register["type"] = register_type
 
-        if data.get("Parameter"):
-            register["parameter"] = str(data.get("Parameter"))
+        register["user_level"] = self._parse_access_level(data.get("UserLevel"))
+        register["expert_level"] = self._parse_access_level(data.get("ExpertLevel"))
 
-        # Remove empty string values
-        register = {k: v for k, v in register.items() if v not in [None, ""]}
-
-        return register if register.get("starting_address") and register.get("name") else None
-
-    def _parse_function_code(self, functions: Any) -> str:
-        """Parse Modbus function code(s)."""
+        # Optional fields - normalize index to use German prefixes
+        # Each cell is looked up once
+        index = data.get("Index")
+        if index:
+            index = self._normalize_index(str(index).strip())
+            if index:
+                register["index"] = index
+
+        unit_or_table = data.get("Unit/ValueTable")
+        if unit_or_table:
+            unit_or_table = str(unit_or_table).strip()
+            if unit_or_table:
+                register["unit_value_table"] = unit_or_table
+
+        min_value = data.get("Min")
+        if min_value not in (None, ""):
+            register["min"] = min_value
+
+        max_value = data.get("Max")
+        if max_value not in (None, ""):
+            register["max"] = max_value
+
+        num_regs = data.get("NumberOfRegisters")
+        if num_regs and num_regs != 1:
+            register["number_of_registers"] = int(num_regs)
+
+        register_id = data.get("ID")
+        if register_id:
+            register["id"] = str(register_id)
+
+        parameter = data.get("Parameter")
+        if parameter:
+            register["parameter"] = str(parameter)
+
+        return register
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _parse_function_code(functions: Any) -> str:
+        """Parse Modbus function code(s).
+
+        Cached per cell value; sheets only use a handful of distinct values.
+        """
         if not functions:
             return "04"
 
@@ -210,8 +293,13 @@ class ModbusInfoConverter:
 
         return "04"  # Default to input registers
 
-    def _parse_access_level(self, access: Any) -> str:
-        """Parse access level."""
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _parse_access_level(access: Any) -> str:
+        """Parse access level.
+
+        Cached per cell value; sheets only use a handful of distinct values.
+        """
         if not access:
             return "read"
 
@@ -228,15 +316,17 @@ class ModbusInfoConverter:
 
     def read_value_tables(self, workbook: openpyxl.Workbook) -> dict:
         """Read value tables from Excel."""
-        if self.VALUE_TABLES_SHEET not in workbook.sheetnames:
+        try:
+            sheet = workbook[self.VALUE_TABLES_SHEET]
+        except KeyError:
             return {}
 
-        sheet = workbook[self.VALUE_TABLES_SHEET]
         value_tables = {}
 
         # Read rows (skip header)
         for row in sheet.iter_rows(min_row=2, values_only=True):
-            if not any(row) or row[0] is None:
+            # Skip empty rows or rows without key; any() only runs for falsy keys like 0
+            if not row or row[0] is None or not (row[0] or any(row)):
                 continue
 
             table_name = str(row[0]).strip() if row[0] else None
@@ -244,23 +334,23 @@ class ModbusInfoConverter:
             translation = str(row[2]).strip() if len(row) > 2 and row[2] else None
 
             if table_name and value is not None and translation:
-                if table_name not in value_tables:
-                    value_tables[table_name] = {}
-                value_tables[table_name][str(value)] = translation
+                value_tables.setdefault(table_name, {})[str(value)] = translation
 
         return value_tables
 
     def read_alarm_codes(self, workbook: openpyxl.Workbook) -> list[dict]:
         """Read alarm codes from Excel."""
-        if self.ALARMS_SHEET not in workbook.sheetnames:
+        try:
+            sheet = workbook[self.ALARMS_SHEET]
+        except KeyError:
             return []
 
-        sheet = workbook[self.ALARMS_SHEET]
         alarm_codes = []
 
         # Read rows (skip header)
         for row in sheet.iter_rows(min_row=2, values_only=True):
-            if not any(row) or row[0] is None:
+            # Skip empty rows or rows without key; any() only runs for falsy keys like 0
+            if not row or row[0] is None or not (row[0] or any(row)):
                 continue
 
             alarm = {
@@ -292,62 +382,77 @@ class ModbusInfoConverter:
         for reg in override_registers:
             merged[reg["starting_address"]] = reg
 
-        # Return sorted by address
-        return sorted(merged.values(), key=lambda x: x["starting_address"])
+        # Return sorted by address (the keys are the addresses, so sort plain ints)
+        return [merged[address] for address in sorted(merged)]
+
+    def convert_file(self, xlsx_file: Path) -> bool:
+        """Convert a single ModbusInfo Excel file to JSON.
 
-    def convert_file(self, xlsx_file: Path) -> None:
-        """Convert a single ModbusInfo Excel file to JSON."""
-        logger.info(f"Converting {xlsx_file.name}...")
+        Returns True if the file was converted successfully.
+        """
+        logger.info("Converting %s...", xlsx_file.name)
 
         # Parse filename
         file_info = self.parse_filename(xlsx_file.name)
         if not file_info:
-            logger.error(f"Could not parse filename: {xlsx_file.name}")
-            return
+            logger.error("Could not parse filename: %s", xlsx_file.name)
+            return False
 
         version = file_info["version"]
         language = file_info["language"]
 
-        # Create output directory structure
+        # Create output directory structure (the first subdirectory creates its parents)
         version_dir = self.output_dir / f"v{version}" / language
-        version_dir.mkdir(parents=True, exist_ok=True)
-
-        # Create subdirectories
         devices_dir = version_dir / "devices"
         equipment_dir = version_dir / "equipment"
-        devices_dir.mkdir(exist_ok=True)
+        devices_dir.mkdir(parents=True, exist_ok=True)
         equipment_dir.mkdir(exist_ok=True)
 
-        # Load workbook
+        # Load workbook (read-only streams rows instead of building the full cell model)
         try:
-            workbook = openpyxl.load_workbook(xlsx_file, data_only=True)
+            workbook = openpyxl.load_workbook(xlsx_file, read_only=True, data_only=True)
         except Exception as exc:
-            logger.error(f"Error loading workbook {xlsx_file}: {exc}")
-            return
+            logger.error("Error loading workbook %s: %s", xlsx_file, exc)
+            return False
+
+        try:
+            self._convert_workbook(workbook, version_dir, devices_dir, equipment_dir)
+        finally:
+            # Read-only workbooks keep the file open until closed
+            workbook.close()
+
+        logger.info("✓ Successfully converted %s\n", xlsx_file.name)
+        return True
+
+    def _convert_workbook(
+        self, workbook: openpyxl.Workbook, version_dir: Path, devices_dir: Path, equipment_dir: Path
+    ) -> None:
+        """Read all sheets of an open workbook and write the JSON configuration files."""
+        # workbook.sheetnames builds a new list on every access - snapshot it once
+        sheetnames = set(workbook.sheetnames)
 
         # Read universal registers from all universal sheets
         universal_registers = []
         for sheet_name in self.UNIVERSAL_SHEETS:
-            if sheet_name in workbook.sheetnames:
-                logger.info(f"  Reading {sheet_name} sheet...")
+            if sheet_name in sheetnames:
+                logger.info("  Reading %s sheet...", sheet_name)
                 registers = self.read_register_sheet(workbook, sheet_name)
                 universal_registers.extend(registers)
-                logger.info(f"    Found {len(registers)} registers")
+                logger.info("    Found %d registers", len(registers))
 
         # Save universal registers
         modbus_registers_file = version_dir / "modbus_registers.json"
-        with open(modbus_registers_file, 'w', encoding='utf-8') as f:
-            json.dump({
-                "universal_registers": universal_registers
-            }, f, indent=2, ensure_ascii=False)
-        logger.info(f"  Created modbus_registers.json with {len(universal_registers)} universal registers")
+        _write_json(modbus_registers_file, {
+            "universal_registers": universal_registers
+        })
+        logger.info("  Created modbus_registers.json with %d universal registers", len(universal_registers))
 
         # Read Combifire base registers (if exists) - applies to CF 1, CF 1.5, CF 2
         combifire_base_registers = []
-        if "KWB Combifire" in workbook.sheetnames:
-            logger.info(f"  Reading KWB Combifire sheet (base for CF models)...")
+        if "KWB Combifire" in sheetnames:
+            logger.info("  Reading KWB Combifire sheet (base for CF models)...")
             combifire_base_registers = self.read_register_sheet(workbook, "KWB Combifire")
-            logger.info(f"    Found {len(combifire_base_registers)} base registers")
+            logger.info("    Found %d base registers", len(combifire_base_registers))
 
         # CF models that inherit from Combifire
         cf_models = ["KWB CF 1", "KWB CF 1.5", "KWB CF 2"]
@@ -358,99 +463,140 @@ class ModbusInfoConverter:
             if sheet_name == "KWB Combifire":
                 continue
 
-            if sheet_name in workbook.sheetnames:
-                logger.info(f"  Reading {sheet_name} sheet...")
+            if sheet_name in sheetnames:
+                logger.info("  Reading %s sheet...", sheet_name)
                 device_registers = self.read_register_sheet(workbook, sheet_name)
 
                 # Special handling for CF models: merge with Combifire base
                 if sheet_name in cf_models and combifire_base_registers:
-                    logger.info(f"    Merging {len(device_registers)} specific registers with {len(combifire_base_registers)} Combifire base registers...")
+                    logger.info("    Merging %d specific registers with %d Combifire base registers...",
+                                len(device_registers), len(combifire_base_registers))
                     device_registers = self.merge_registers(combifire_base_registers, device_registers)
-                    logger.info(f"    Result: {len(device_registers)} total registers")
+                    logger.info("    Result: %d total registers", len(device_registers))
 
                 if device_registers:
                     filename = self.DEVICE_FILE_MAP.get(sheet_name, f"{sheet_name.lower().replace(' ', '_')}.json")
                     device_file = devices_dir / filename
-                    with open(device_file, 'w', encoding='utf-8') as f:
-                        json.dump({
-                            "registers": device_registers
-                        }, f, indent=2, ensure_ascii=False)
-                    logger.info(f"    Created devices/{filename} with {len(device_registers)} registers")
+                    _write_json(device_file, {
+                        "registers": device_registers
+                    })
+                    logger.info("    Created devices/%s with %d registers", filename, len(device_registers))
 
         # Save Combifire as its own device file too (if it exists)
         if combifire_base_registers:
             combifire_file = devices_dir / "kwb_combifire.json"
-            with open(combifire_file, 'w', encoding='utf-8') as f:
-                json.dump({
-                    "registers": combifire_base_registers
-                }, f, indent=2, ensure_ascii=False)
-            logger.info(f"    Created devices/kwb_combifire.json with {len(combifire_base_registers)} registers")
+            _write_json(combifire_file, {
+                "registers": combifire_base_registers
+            })
+            logger.info("    Created devices/kwb_combifire.json with %d registers", len(combifire_base_registers))
 
         # Read and save equipment-specific registers
         # Check for both German and English sheet names
-        all_equipment_sheets = list(self.EQUIPMENT_SHEETS.keys()) + list(self.EQUIPMENT_SHEETS.values())
         processed_equipment = set()  # Track which equipment we've already processed
 
-        for sheet_name in all_equipment_sheets:
-            if sheet_name in workbook.sheetnames:
+        for sheet_name in self.ALL_EQUIPMENT_SHEETS:
+            if sheet_name in sheetnames:
                 # Get the English filename (consistent for both German and English)
                 filename = self.EQUIPMENT_FILE_MAP.get(sheet_name)
                 if filename and filename not in processed_equipment:
-                    logger.info(f"  Reading {sheet_name} sheet...")
+                    logger.info("  Reading %s sheet...", sheet_name)
                     equipment_registers = self.read_register_sheet(workbook, sheet_name)
                     if equipment_registers:
                         equipment_file = equipment_dir / filename
-                        with open(equipment_file, 'w', encoding='utf-8') as f:
-                            json.dump({
-                                "registers": equipment_registers
-                            }, f, indent=2, ensure_ascii=False)
-                        logger.info(f"    Created equipment/{filename} with {len(equipment_registers)} registers")
+                        _write_json(equipment_file, {
+                            "registers": equipment_registers
+                        })
+                        logger.info("    Created equipment/%s with %d registers", filename, len(equipment_registers))
                         processed_equipment.add(filename)
 
         # Read and save value tables
-        logger.info(f"  Reading {self.VALUE_TABLES_SHEET}...")
+        logger.info("  Reading %s...", self.VALUE_TABLES_SHEET)
         value_tables = self.read_value_tables(workbook)
         value_tables_file = version_dir / "value_tables.json"
-        with open(value_tables_file, 'w', encoding='utf-8') as f:
-            json.dump({
-                "value_tables": value_tables
-            }, f, indent=2, ensure_ascii=False)
-        logger.info(f"  Created value_tables.json with {len(value_tables)} tables")
+        _write_json(value_tables_file, {
+            "value_tables": value_tables
+        })
+        logger.info("  Created value_tables.json with %d tables", len(value_tables))
 
         # Read and save alarm codes
-        logger.info(f"  Reading {self.ALARMS_SHEET}...")
+        logger.info("  Reading %s...", self.ALARMS_SHEET)
         alarm_codes = self.read_alarm_codes(workbook)
         alarm_codes_file = version_dir / "alarm_codes.json"
-        with open(alarm_codes_file, 'w', encoding='utf-8') as f:
-            json.dump({
-                "alarm_codes": alarm_codes
-            }, f, indent=2, ensure_ascii=False)
-        logger.info(f"  Created alarm_codes.json with {len(alarm_codes)} alarms")
+        _write_json(alarm_codes_file, {
+            "alarm_codes": alarm_codes
+        })
+        logger.info("  Created alarm_codes.json with %d alarms", len(alarm_codes))
+
+    def _output_exists(self, xlsx_file: Path) -> bool:
+        """Check whether the output directory for a workbook already exists."""
+        file_info = self.parse_filename(xlsx_file.name)
+        if not file_info:
+            return False
+        version_dir = self.output_dir / f"v{file_info['version']}" / file_info["language"]
+        return (version_dir / "modbus_registers.json").exists()
+
+    def _load_cache(self) -> dict[str, str]:
+        """Load content hashes of previously converted workbooks."""
+        cache_file = self.output_dir / _CACHE_FILENAME
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
 
-        logger.info(f"✓ Successfully converted {xlsx_file.name}\n")
+    def _save_cache(self, cache: dict[str, str]) -> None:
+        """Persist content hashes of converted workbooks."""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.output_dir / _CACHE_FILENAME, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, indent=2, sort_keys=True)
 
     def convert_all(self) -> None:
         """Convert all ModbusInfo Excel files in input directory."""
-        xlsx_files = list(self.input_dir.glob("ModbusInfo*.xlsx"))
+        # scandir entries carry the file type, so no extra stat per file
+        with os.scandir(self.input_dir) as entries:
+            xlsx_files = [
+                Path(entry.path) for entry in entries
+                if entry.name.startswith("ModbusInfo") and entry.name.endswith(".xlsx") and entry.is_file()
+            ]
 
         if not xlsx_files:
-            logger.error(f"No ModbusInfo*.xlsx files found in {self.input_dir}")
+            logger.error("No ModbusInfo*.xlsx files found in %s", self.input_dir)
             return
 
-        logger.info(f"Found {len(xlsx_files)} files to convert\n")
+        logger.info("Found %d files to convert\n", len(xlsx_files))
+
+        cache = self._load_cache()
+        pending: dict[Path, str] = {}
+
+        # The converter's own source is part of every hash, so changing the
+        # conversion logic reconverts all workbooks
+        converter_digest = hashlib.blake2b(Path(__file__).read_bytes(), digest_size=16).digest()
 
         for xlsx_file in xlsx_files:
-            try:
-                self.convert_file(xlsx_file)
-            except Exception as exc:
-                logger.error(f"Error converting {xlsx_file.name}: {exc}")
-                import traceback
-                traceback.print_exc()
+            # Skip workbooks whose content is unchanged since the last conversion
+            digest = _file_digest(xlsx_file, converter_digest)
+            if cache.get(xlsx_file.name) == digest and self._output_exists(xlsx_file):
+                logger.info("Skipping %s (unchanged)\n", xlsx_file.name)
                 continue
+            pending[xlsx_file] = digest
+
+        # Workbooks are independent of each other, so convert them in parallel
+        files = list(pending)
+        if len(files) > 1:
+            with ProcessPoolExecutor(max_workers=min(len(files), os.cpu_count() or 1)) as executor:
+                results = list(executor.map(_convert_worker, [self] * len(files), files))
+        else:
+            results = [_convert_worker(self, xlsx_file) for xlsx_file in files]
+
+        converted = [xlsx_file for xlsx_file, ok in zip(files, results) if ok]
+        for xlsx_file in converted:
+            cache[xlsx_file.name] = pending[xlsx_file]
+        if converted:
+            self._save_cache(cache)
 
         logger.info("="*60)
         logger.info("Conversion complete!")
-        logger.info(f"Output directory: {self.output_dir}")
+        logger.info("Output directory: %s", self.output_dir)
 
 
 def main():
@@ -460,12 +606,12 @@ def main():
     output_dir = script_dir / "config" / "versions"
 
     if not input_dir.exists():
-        logger.error(f"Input directory not found: {input_dir}")
+        logger.error("Input directory not found: %s", input_dir)
         sys.exit(1)
 
     logger.info("KWB ModbusInfo to JSON Converter")
-    logger.info(f"Input directory: {input_dir}")
-    logger.info(f"Output directory: {output_dir}")
+    logger.info("Input directory: %s", input_dir)
+    logger.info("Output directory: %s", output_dir)
     logger.info("="*60)
     logger.info("")
 